@@ -370,4 +370,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Optional: uvloop cuts event-loop overhead roughly in half for the
+    # async-I/O-heavy trading loop; fall back to stock asyncio if missing
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -4,18 +4,73 @@ Complete triangular and cross-DEX arbitrage system
 """
 
 import asyncio
+import functools
 import logging
+import math
 import time
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from web3 import Web3
+import numpy as np
+from eth_abi import decode as abi_decode, encode as abi_encode
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebSocketProvider
 from eth_typing import ChecksumAddress
 import json
 
 logger = logging.getLogger(__name__)
 
+# Precompiled read-path calldata pieces: selector for
+# getAmountsOut(uint256,address[]) plus eth_abi type strings, so quotes
+# skip the per-call contract/function machinery entirely
+_GETAMOUNTSOUT_SELECTOR = bytes.fromhex("d06ca61f")
+_GETAMOUNTSOUT_ARG_TYPES = ["uint256", "address[]"]
+_GETAMOUNTSOUT_RET_TYPES = ["uint256[]"]
 
-@dataclass
+# Router ABI hoisted to module level - building the list per call made
+# web3 re-parse the types every time
+_ROUTER_ABI = [
+    {
+        "inputs": [{"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+                   {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
+                   {"internalType": "address[]", "name": "path", "type": "address[]"},
+                   {"internalType": "address", "name": "to", "type": "address"},
+                   {"internalType": "uint256", "name": "deadline", "type": "uint256"}],
+        "name": "swapExactTokensForTokens",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "nonpayable", "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+                   {"internalType": "address[]", "name": "path", "type": "address[]"}],
+        "name": "getAmountsOut",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "view", "type": "function"
+    }
+]
+
+# Minimal ABIs for reserve lookups on v2-style pools
+_V2_FACTORY_ABI = [
+    {
+        "inputs": [{"internalType": "address", "name": "tokenA", "type": "address"},
+                   {"internalType": "address", "name": "tokenB", "type": "address"}],
+        "name": "getPair",
+        "outputs": [{"internalType": "address", "name": "pair", "type": "address"}],
+        "stateMutability": "view", "type": "function"
+    }
+]
+
+_V2_PAIR_ABI = [
+    {
+        "inputs": [],
+        "name": "getReserves",
+        "outputs": [{"internalType": "uint112", "name": "reserve0", "type": "uint112"},
+                    {"internalType": "uint112", "name": "reserve1", "type": "uint112"},
+                    {"internalType": "uint32", "name": "blockTimestampLast", "type": "uint32"}],
+        "stateMutability": "view", "type": "function"
+    }
+]
+
+
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     token_in: str
     token_out: str
@@ -23,7 +78,7 @@ class ArbitrageOpportunity:
     expected_profit: float
     path: List[str]
     exchanges: List[str]
-    gas_estimate: float
+    gas_estimate: float = 30.0
 
 
 class ArbitrageEngine:
@@ -40,6 +95,8 @@ class ArbitrageEngine:
     UNISWAP_V3_ROUTER = "0xE592427A0AEce92De3Edee1F18E0157C05861564"
     SUSHISWAP_ROUTER = "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"
     BALANCER_VAULT = "0xBA12222222228d8Ba445958a75a0704d566BF2C"
+    UNISWAP_V2_FACTORY = "0x5C69bEe701ef814a2B6fe3cF77eE1eD5e2b3f2c4"
+    SUSHISWAP_FACTORY = "0xC0AEe478e3658e2610c5F7A4A2E1777cE9e4f2Ac"
     
     # Common tokens
     WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
@@ -48,11 +105,48 @@ class ArbitrageEngine:
     DAI = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
     WBTC = "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599"
     
-    def __init__(self, web3: Web3, private_key: str):
+    def __init__(self, web3: Web3, private_key: str, ws_url: Optional[str] = None):
         self.web3 = web3
         self.account = web3.eth.account.from_key(private_key)
         self.logger = logging.getLogger(__name__)
-        
+
+        # Async read path: one AsyncWeb3 over a persistent aiohttp session
+        # (HTTP keep-alive), so quote traffic amortizes TCP/TLS handshakes
+        # and never blocks the event loop. Execution keeps the sync web3.
+        self.async_web3: Optional[AsyncWeb3] = None
+        endpoint = getattr(web3.provider, "endpoint_uri", None)
+        if endpoint:
+            self.async_web3 = AsyncWeb3(AsyncHTTPProvider(endpoint))
+
+        # Optional dedicated WebSocket provider for the hot quote path -
+        # a single persistent connection beats per-request HTTP framing.
+        # Transaction submission stays on HTTP for reliability.
+        self.ws_url = ws_url
+        self._ws_web3: Optional[AsyncWeb3] = None
+        self._ws_connected = False
+        self._ws_retry_after = 0.0  # Backoff deadline after a failed connect
+
+        # Pre-warmed EIP-1559 fee cache refreshed by a background task so
+        # submission never spends round-trips asking for gas prices
+        self._base_fee: Optional[int] = None
+        self._priority_fee: Optional[int] = None
+        self._gas_updated_at = 0.0
+        self._gas_oracle_task: Optional[asyncio.Task] = None
+
+        # v2-style factories for reserve lookups, keyed by scan dex name
+        self._factories = {
+            "uniswap_v2": self.UNISWAP_V2_FACTORY,
+            "sushiswap": self.SUSHISWAP_FACTORY,
+        }
+
+        # Per-scan reserve cache keyed on (token_in, token_out, dex)
+        self._reserves_cache: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+
+        # Per-scan price cache keyed on (token_in, token_out, router),
+        # cleared at the start of each scan cycle so repeated edge lookups
+        # within a cycle cost one RPC instead of one per reference
+        self._price_cache: Dict[Tuple[str, str, str], float] = {}
+
         # Token decimals
         self.decimals = {
             self.WETH: 18,
@@ -61,123 +155,372 @@ class ArbitrageEngine:
             self.DAI: 18,
             self.WBTC: 8
         }
+
+        # Precomputed 10**decimals scaling factors - avoids per-quote
+        # integer exponentiation on the hot path
+        self._scale = {addr: 10 ** dec for addr, dec in self.decimals.items()}
+        self._scale_default = 10 ** 18
     
+    # Tokens considered by the triangular scan - adding one here scales the
+    # graph search linearly, unlike the old hand-listed triplet table
+    SCAN_TOKENS = (WETH, USDC, USDT, DAI, WBTC)
+
+    # Roots whose token units are USD-denominated: curve sizing computes
+    # profit in root-token units and execution sizes the flash loan in
+    # USD stables, so only these cycles may take the sizing branch
+    STABLE_ROOTS = (USDC, USDT, DAI)
+
+    # Routers quoted on the hot scan path
+    SCAN_DEXES = (
+        ("uniswap_v2", UNISWAP_V2_ROUTER),
+        ("sushiswap", SUSHISWAP_ROUTER),
+    )
+
+    # Swap gas is highly predictable per hop - a table lookup replaces the
+    # node-side estimate_gas simulation on the submission critical path
+    GAS_PER_HOP = {
+        "uniswap_v2": 110_000,
+        "sushiswap": 110_000,
+        "uniswap_v3": 150_000,
+    }
+    GAS_BASE = 50_000
+
     async def find_triangular_opportunities(self, min_profit: float = 10) -> List[ArbitrageOpportunity]:
-        """Find triangular arbitrage opportunities"""
+        """Find triangular arbitrage opportunities via negative-cycle search"""
+        self._price_cache.clear()
+        self._reserves_cache.clear()
         opportunities = []
-        
-        # Token triplets for arbitrage
-        triplets = [
-            # Stablecoin triangles
-            (self.USDC, self.USDT, self.WETH),
-            (self.USDC, self.DAI, self.WETH),
-            (self.USDT, self.USDC, self.WETH),
-            (self.DAI, self.USDC, self.WETH),
-            # WBTC triangles
-            (self.WBTC, self.WETH, self.USDC),
-            (self.WETH, self.WBTC, self.USDC),
+
+        # Fetch every directed (token, token, dex) edge concurrently
+        edges = [
+            (token_a, token_b, dex_name, router)
+            for token_a in self.SCAN_TOKENS
+            for token_b in self.SCAN_TOKENS
+            if token_a != token_b
+            for dex_name, router in self.SCAN_DEXES
         ]
-        
-        for token_a, token_b, token_c in triplets:
-            try:
-                # Check all 6 paths in triangle
-                paths = [
-                    [token_a, token_b, token_a],  # A -> B -> A
-                    [token_a, token_c, token_a],  # A -> C -> A
-                    [token_b, token_a, token_b],  # B -> A -> B
-                    [token_b, token_c, token_b],  # B -> C -> B
-                    [token_c, token_a, token_c],  # C -> A -> C
-                    [token_c, token_b, token_c],  # C -> B -> C
-                ]
-                
-                for path in paths:
-                    profit = await self._calculate_triangular_profit(path)
-                    if profit >= min_profit:
-                        opp = ArbitrageOpportunity(
-                            token_in=path[0],
-                            token_out=path[-1],
-                            amount_in=10000,  # Default flash loan amount
-                            expected_profit=profit,
-                            path=path,
-                            exchanges=["uniswap_v2", "sushiswap", "uniswap_v3"]
-                        )
-                        opportunities.append(opp)
-                        
-            except Exception as e:
-                self.logger.debug(f"Error checking triplet {token_a}-{token_b}-{token_c}: {e}")
-        
+        results = await asyncio.gather(
+            *[self._get_price(a, b, router) for a, b, _, router in edges]
+        )
+
+        # Model tokens as vertices and quotes as weighted directed edges
+        # (weight = -log rate, so a negative cycle is a profitable loop;
+        # getAmountsOut quotes already include the pool fee)
+        graph: Dict[str, List[Tuple[str, str, float, float]]] = {
+            token: [] for token in self.SCAN_TOKENS
+        }
+        for (token_a, token_b, dex_name, _), rate in zip(edges, results):
+            if rate and rate > 0:
+                graph[token_a].append((token_b, dex_name, rate, -math.log(rate)))
+
+        cycles = self._find_negative_cycles(graph, max_hops=4)
+        if not cycles:
+            return opportunities
+
+        # Vectorized linear screen across all candidate cycles - only
+        # survivors pay for reserve fetches and proper sizing below
+        base_amount = 10000  # Default flash loan amount
+        rates = np.fromiter(
+            (rate for _, _, rate in cycles), dtype=np.float64, count=len(cycles)
+        )
+        profits = base_amount * rates - base_amount - 30  # Gas ~$30
+
+        for idx in np.where(profits >= min_profit)[0]:
+            path, dexes, _ = cycles[idx]
+
+            amount_in = base_amount
+            profit = float(profits[idx])
+
+            # Size the trade against real AMM curves: fetch the v2 reserves
+            # along the path and solve for the profit-maximizing input.
+            # The sized profit is denominated in the root token, so only
+            # USD-stable roots may take this branch - subtracting $30 gas
+            # from e.g. a WETH amount would silently drop every profitable
+            # non-stable cycle. Others keep the linear USD estimate.
+            if path[0] in self.STABLE_ROOTS:
+                reserves = await asyncio.gather(*[
+                    self._get_pair_reserves(path[i], path[i + 1], dexes[i])
+                    for i in range(len(path) - 1)
+                ])
+                if all(reserves):
+                    scale = self._scale.get(path[0], self._scale_default)
+                    raw_optimal = self._optimal_size(reserves)
+                    if raw_optimal <= 0:
+                        continue  # Profitable on linear quotes, not on the curve
+                    raw_out = self._amount_out_v2(raw_optimal, reserves)
+                    amount_in = raw_optimal / scale
+                    profit = (raw_out - raw_optimal) / scale - 30
+
+            if profit >= min_profit:
+                opportunities.append(ArbitrageOpportunity(
+                    token_in=path[0],
+                    token_out=path[-1],
+                    amount_in=amount_in,
+                    expected_profit=profit,
+                    path=path,
+                    exchanges=dexes,
+                    gas_estimate=30
+                ))
+
         return opportunities
-    
-    async def _calculate_triangular_profit(self, path: List[str]) -> float:
-        """Calculate profit from triangular path"""
-        if len(path) < 3:
-            return 0
-            
-        # Simplified - in production, query real prices
-        # This is a placeholder showing the logic
-        base_amount = 10000
-        
-        # Get prices from each DEX
-        price1 = await self._get_price(path[0], path[1], self.UNISWAP_V2_ROUTER)
-        price2 = await self._get_price(path[1], path[2], self.SUSHISWAP_ROUTER)
-        
-        if not price1 or not price2:
+
+    async def _get_pair_reserves(
+        self, token_in: str, token_out: str, dex_name: str
+    ) -> Optional[Tuple[int, int]]:
+        """Fetch v2 pair reserves ordered as (reserve_in, reserve_out)"""
+        cache_key = (token_in, token_out, dex_name)
+        cached = self._reserves_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        factory_addr = self._factories.get(dex_name)
+        read_web3 = await self._get_read_web3()
+        if not factory_addr or read_web3 is None:
+            return None
+
+        try:
+            factory = read_web3.eth.contract(
+                address=Web3.to_checksum_address(factory_addr),
+                abi=_V2_FACTORY_ABI
+            )
+            pair = await factory.functions.getPair(
+                Web3.to_checksum_address(token_in),
+                Web3.to_checksum_address(token_out)
+            ).call()
+            if int(pair, 16) == 0:
+                return None
+
+            pair_contract = read_web3.eth.contract(address=pair, abi=_V2_PAIR_ABI)
+            reserve0, reserve1, _ = await pair_contract.functions.getReserves().call()
+
+            # getReserves orders by token address, not by trade direction
+            if token_in.lower() < token_out.lower():
+                reserves = (reserve0, reserve1)
+            else:
+                reserves = (reserve1, reserve0)
+
+            self._reserves_cache[cache_key] = reserves
+            return reserves
+
+        except Exception as e:
+            self.logger.debug(f"Reserve fetch failed for {dex_name}: {e}")
+            return None
+
+    @staticmethod
+    def _amount_out_v2(amount_in: int, reserves: List[Tuple[int, int]]) -> int:
+        """Chain the Uniswap V2 constant-product formula along a path"""
+        amount = amount_in
+        for reserve_in, reserve_out in reserves:
+            amount_with_fee = amount * 997
+            amount = amount_with_fee * reserve_out // (reserve_in * 1000 + amount_with_fee)
+        return amount
+
+    def _optimal_size(self, reserves: List[Tuple[int, int]]) -> int:
+        """Profit-maximizing input size via bisection on the marginal profit
+
+        The chained constant-product output is concave, so the marginal
+        profit is monotonically decreasing and a handful of bisection steps
+        pin down where it crosses zero - no convex solver needed.
+        """
+        # Cap the search at a third of the entry pool's input reserve
+        # (reserves along the path are in different token units); beyond
+        # that slippage dominates and the marginal is certainly negative
+        max_amount = reserves[0][0] // 3
+        if max_amount <= 0:
             return 0
-        
-        # Calculate final amount
-        intermediate = base_amount * price1
-        final = intermediate * price2
-        
-        profit = final - base_amount
-        
-        # Subtract gas estimate (~0.01 ETH = $30)
-        gas_cost = 30
-        profit -= gas_cost
-        
-        return profit
-    
+
+        eps = max(1, max_amount >> 20)
+        if self._amount_out_v2(eps, reserves) <= eps:
+            return 0  # Unprofitable even at the margin
+
+        lo, hi = 0, max_amount
+        for _ in range(24):
+            mid = (lo + hi) // 2
+            gain = self._amount_out_v2(mid + eps, reserves) - self._amount_out_v2(mid, reserves)
+            if gain > eps:
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def _find_negative_cycles(
+        self,
+        graph: Dict[str, List[Tuple[str, str, float, float]]],
+        max_hops: int = 4
+    ) -> List[Tuple[List[str], List[str], float]]:
+        """Hop-bounded Bellman-Ford negative-cycle detection
+
+        Relaxes the quote graph layer by layer (one layer per hop) from each
+        source token and emits every cycle that closes back on the source
+        with negative total log-weight, i.e. product of rates > 1.
+
+        Paths only visit vertices ordered after their source, so each
+        cycle is emitted exactly once in canonical (minimal-vertex-first)
+        rotation instead of once per member vertex - this also prunes the
+        relaxation fan-out. Returns (path, dex names, cycle rate product)
+        tuples, deduplicated.
+        """
+        cycles = []
+        seen = set()
+
+        for source in graph:
+            # dist[v] = (weight, path, dexes, rate) of best path source -> v
+            # within the current hop layer
+            layer = {source: (0.0, [source], [], 1.0)}
+
+            for _hop in range(max_hops):
+                next_layer: Dict[str, Tuple[float, List[str], List[str], float]] = {}
+                for token, (weight, path, dexes, rate) in layer.items():
+                    for nxt, dex_name, edge_rate, edge_weight in graph[token]:
+                        if nxt == source:
+                            # Cycle closed - profitable iff total weight < 0
+                            total = weight + edge_weight
+                            if total < 0 and len(path) >= 3:
+                                key = (tuple(path), tuple(dexes + [dex_name]))
+                                if key not in seen:
+                                    seen.add(key)
+                                    cycles.append((
+                                        path + [source],
+                                        dexes + [dex_name],
+                                        rate * edge_rate
+                                    ))
+                            continue
+                        if nxt < source:
+                            # Canonical rotations only: every cycle is
+                            # found from its minimal vertex
+                            continue
+                        if nxt in path:
+                            continue  # Simple paths only
+                        candidate = weight + edge_weight
+                        best = next_layer.get(nxt)
+                        if best is None or candidate < best[0]:
+                            next_layer[nxt] = (
+                                candidate,
+                                path + [nxt],
+                                dexes + [dex_name],
+                                rate * edge_rate
+                            )
+                layer = next_layer
+                if not layer:
+                    break
+
+        return cycles
+
+    def start_gas_oracle(self, refresh_interval: float = 3.0):
+        """Start the background fee refresher (idempotent)"""
+        if self._gas_oracle_task is None or self._gas_oracle_task.done():
+            self._gas_oracle_task = asyncio.create_task(
+                self._gas_oracle_loop(refresh_interval)
+            )
+
+    async def _gas_oracle_loop(self, refresh_interval: float):
+        """Refresh baseFeePerGas / maxPriorityFeePerGas off the critical path"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                block = await loop.run_in_executor(
+                    None, self.web3.eth.get_block, 'latest'
+                )
+                self._base_fee = block['baseFeePerGas']
+                self._priority_fee = await loop.run_in_executor(
+                    None, lambda: self.web3.eth.max_priority_fee
+                )
+                self._gas_updated_at = time.time()
+            except Exception as e:
+                self.logger.debug(f"Gas oracle refresh failed: {e}")
+            await asyncio.sleep(refresh_interval)
+
+    async def _get_read_web3(self) -> Optional[AsyncWeb3]:
+        """Pick the async provider for read traffic, preferring WebSocket"""
+        if self.ws_url:
+            if self._ws_web3 is None:
+                self._ws_web3 = AsyncWeb3(WebSocketProvider(self.ws_url))
+            if not self._ws_connected and time.time() >= self._ws_retry_after:
+                try:
+                    # Bound the attempt - the provider retries internally
+                    # with backoff and would otherwise block quotes forever
+                    await asyncio.wait_for(self._ws_web3.provider.connect(), timeout=5)
+                    self._ws_connected = True
+                except Exception as e:
+                    self._ws_retry_after = time.time() + 60
+                    self.logger.debug(f"WS connect failed, using HTTP: {e}")
+            if self._ws_connected:
+                return self._ws_web3
+        return self.async_web3
+
     async def _get_price(self, token_in: str, token_out: str, dex_router: str) -> Optional[float]:
         """Get price from DEX"""
+        cache_key = (token_in, token_out, dex_router)
+        cached = self._price_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            router = self.web3.eth.contract(
-                address=Web3.to_checksum_address(dex_router),
-                abi=self._get_router_abi()
-            )
-            
-            amount_in = 10 ** self.decimals.get(token_in, 18)
-            amounts = router.functions.getAmountsOut(
-                amount_in,
-                [token_in, token_out]
-            ).call()
-            
+            amount_in = self._scale.get(token_in, self._scale_default)
+
+            # Build calldata directly from the precompiled selector - no
+            # per-call contract object or ABI parsing on the hot path
+            call = {
+                "to": Web3.to_checksum_address(dex_router),
+                "data": _GETAMOUNTSOUT_SELECTOR + abi_encode(
+                    _GETAMOUNTSOUT_ARG_TYPES, [amount_in, [token_in, token_out]]
+                ),
+            }
+
+            read_web3 = await self._get_read_web3()
+            if read_web3 is not None:
+                # Non-blocking call over the WS connection or the shared
+                # keep-alive HTTP session
+                raw = await read_web3.eth.call(call)
+            else:
+                # No HTTP endpoint to derive an async provider from - run the
+                # synchronous web3 call off the event loop so concurrent
+                # gathers still overlap their round-trips
+                loop = asyncio.get_running_loop()
+                raw = await loop.run_in_executor(None, self.web3.eth.call, call)
+
+            (amounts,) = abi_decode(_GETAMOUNTSOUT_RET_TYPES, raw)
+
             if amounts[1] > 0:
-                return amounts[1] / (10 ** self.decimals.get(token_out, 18))
-                
+                price = amounts[1] / self._scale.get(token_out, self._scale_default)
+                self._price_cache[cache_key] = price
+                return price
+
+        except (ConnectionError, OSError) as e:
+            # Dropped WS connection - reconnect on the next quote
+            self._ws_connected = False
+            self.logger.debug(f"Price connection error: {e}")
         except Exception as e:
             self.logger.debug(f"Price error: {e}")
-            
+
         return None
     
     async def find_cross_dex_opportunities(self, token_pair: str, min_profit: float = 20) -> List[ArbitrageOpportunity]:
         """Find cross-DEX arbitrage (buy low on one, sell high on other)"""
+        self._price_cache.clear()
         opportunities = []
-        
+
+        # Parse the pair once instead of re-splitting per opportunity
+        tokens = token_pair.split("-")
+        if len(tokens) != 2:
+            return opportunities
+        token_in, token_out = tokens
+
         dexes = [
             ("uniswap_v2", self.UNISWAP_V2_ROUTER),
             ("sushiswap", self.SUSHISWAP_ROUTER),
             ("uniswap_v3", self.UNISWAP_V3_ROUTER),
         ]
-        
+
         prices = {}
-        
-        # Get prices from all DEXes
+
+        # Get prices from all DEXes - _get_price signals failure with None
+        # (network errors are narrowed and logged inside it), so there is
+        # no exception control flow on this path
         for dex_name, router_addr in dexes:
-            try:
-                price = await self._get_price_for_pair(token_pair, router_addr)
-                if price:
-                    prices[dex_name] = price
-            except:
-                pass
+            price = await self._get_price(token_in, token_out, router_addr)
+            if price is not None:
+                prices[dex_name] = price
         
         # Find arbitrage between DEXes
         if len(prices) >= 2:
@@ -196,57 +539,73 @@ class ArbitrageEngine:
                             sell_dex = dex_a
                         
                         opp = ArbitrageOpportunity(
-                            token_in=token_pair.split("-")[0],
-                            token_out=token_pair.split("-")[-1],
+                            token_in=token_in,
+                            token_out=token_out,
                             amount_in=10000,
                             expected_profit=profit - 30,  # Subtract gas
-                            path=[token_pair.split("-")[0], token_pair.split("-")[-1]],
-                            exchanges=[buy_dex, sell_dex]
+                            path=[token_in, token_out],
+                            exchanges=[buy_dex, sell_dex],
+                            gas_estimate=30
                         )
                         opportunities.append(opp)
         
         return opportunities
     
-    async def _get_price_for_pair(self, pair: str, router: str) -> Optional[float]:
-        """Get price for token pair"""
-        tokens = pair.split("-")
-        if len(tokens) != 2:
-            return None
-        return await self._get_price(tokens[0], tokens[1], router)
-    
     async def execute_arbitrage(self, opportunity: ArbitrageOpportunity) -> Dict:
         """Execute arbitrage trade - REAL PRODUCTION EXECUTION"""
         try:
             self.logger.info(f"Executing arbitrage: {opportunity.path}")
             self.logger.info(f"Expected profit: ${opportunity.expected_profit:.2f}")
             
+            # All sync web3 calls below run in a thread executor so the
+            # event loop (and concurrent scans) keep running while a
+            # transaction is built, submitted, and confirmed
+            loop = asyncio.get_running_loop()
+
             # Step 1: Prepare flash loan parameters
             loan_amount = int(opportunity.amount_in * 1e6)  # USDC has 6 decimals
-            
-            # Step 2: Build the arbitrage transaction
-            tx_data = self._build_arbitrage_tx(opportunity, loan_amount)
-            
-            # Step 3: Estimate gas
-            try:
-                gas_estimate = self.web3.eth.estimate_gas(tx_data)
-                gas_limit = int(gas_estimate * 1.2)  # 20% buffer
-            except:
-                gas_limit = 0  # No fallback - require real estimate; logger.warning("Cannot estimate gas")
-            
-            # Step 4: Get current gas prices
-            latest_block = self.web3.eth.get_block('latest')
-            base_fee = latest_block['baseFeePerGas']
-            
+
+            # Step 2: Build the arbitrage transaction (fetches the nonce)
+            tx_data = await loop.run_in_executor(
+                None, self._build_arbitrage_tx, opportunity, loan_amount
+            )
+
+            # Step 3: Gas limit from the per-hop table (20% buffer) - skips
+            # the estimate_gas round-trip, which made the node simulate the
+            # whole tx before we could submit it
+            gas_limit = self._gas_limit_for(opportunity)
+
+            # Step 4: Get current gas prices - read the pre-warmed oracle
+            # when fresh, saving two RPC round-trips before submission
+            if self._base_fee is not None and time.time() - self._gas_updated_at < 15:
+                base_fee = self._base_fee
+                priority_fee = self._priority_fee
+            else:
+                latest_block = await loop.run_in_executor(
+                    None, self.web3.eth.get_block, 'latest'
+                )
+                base_fee = latest_block['baseFeePerGas']
+                priority_fee = await loop.run_in_executor(
+                    None, lambda: self.web3.eth.max_priority_fee
+                )
+
             tx_data['gas'] = gas_limit
             tx_data['maxFeePerGas'] = int(base_fee * 2)
-            tx_data['maxPriorityFeePerGas'] = self.web3.eth.max_priority_fee
-            
-            # Step 5: Sign and send transaction
+            tx_data['maxPriorityFeePerGas'] = priority_fee
+
+            # Step 5: Sign and send transaction (signing is local CPU)
             signed_tx = self.web3.eth.account.sign_transaction(tx_data, self.account.key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            
-            # Step 6: Wait for confirmation
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            tx_hash = await loop.run_in_executor(
+                None, self.web3.eth.send_raw_transaction, signed_tx.raw_transaction
+            )
+
+            # Step 6: Wait for confirmation - up to 2 minutes, off the loop
+            receipt = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+                )
+            )
             
             if receipt['status'] == 1:
                 # Calculate actual profit from gas spent
@@ -283,6 +642,13 @@ class ArbitrageEngine:
             self.logger.error(f"Arbitrage execution failed: {e}")
             return {"status": "failed", "error": str(e)}
     
+    def _gas_limit_for(self, opportunity: ArbitrageOpportunity) -> int:
+        """Gas limit from the per-hop table with a 20% buffer"""
+        hops = sum(
+            self.GAS_PER_HOP.get(dex, 150_000) for dex in opportunity.exchanges
+        )
+        return int((hops + self.GAS_BASE) * 1.2)
+
     def _build_arbitrage_tx(self, opportunity: ArbitrageOpportunity, loan_amount: int) -> Dict:
         """Build arbitrage transaction with flash loan"""
         
@@ -359,66 +725,105 @@ class ArbitrageEngine:
         ]
     
     def _get_router_abi(self):
-        return [
-            {
-                "inputs": [{"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                          {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                          {"internalType": "address[]", "name": "path", "type": "address[]"},
-                          {"internalType": "address", "name": "to", "type": "address"},
-                          {"internalType": "uint256", "name": "deadline", "type": "uint256"}],
-                "name": "swapExactTokensForTokens",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "nonpayable", "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                          {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                          {"internalType": "address[]", "name": "path", "type": "address[]"},
-                          {"internalType": "address", "name": "to", "type": "address"},
-                          {"internalType": "uint256", "name": "deadline", "type": "uint256"}],
-                "name": "getAmountsOut",
-                "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
-                "stateMutability": "view", "type": "function"
-            }
-        ]
+        return _ROUTER_ABI
 
 
 class ProductionTradingLoop:
     """Main production trading loop"""
     
-    def __init__(self, web3: Web3, private_key: str):
+    def __init__(self, web3: Web3, private_key: str, ws_url: Optional[str] = None):
         self.web3 = web3
-        self.arbitrage_engine = ArbitrageEngine(web3, private_key)
+        self.arbitrage_engine = ArbitrageEngine(web3, private_key, ws_url=ws_url)
         self.is_running = False
-        self.check_interval = 5  # Check every 5 seconds
-        
+        self.check_interval = 5  # Polling fallback when no WS endpoint
+
+        # Bounded hand-off between the scan and execute loops; stale
+        # opportunities are dropped from the front when it fills up
+        self.opp_queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+
     async def start(self):
-        """Start production trading"""
+        """Start production trading
+
+        Runs scanning and execution as independent tasks so opportunity
+        detection keeps going while a transaction waits for confirmation.
+        """
         self.is_running = True
         logger.info("🚀 PRODUCTION TRADING STARTED")
-        
+
+        self.arbitrage_engine.start_gas_oracle()
+        scan_task = asyncio.create_task(self._scan_loop())
+        execute_task = asyncio.create_task(self._execute_loop())
+        try:
+            await asyncio.gather(scan_task, execute_task)
+        finally:
+            scan_task.cancel()
+            execute_task.cancel()
+            if self.arbitrage_engine._gas_oracle_task is not None:
+                self.arbitrage_engine._gas_oracle_task.cancel()
+
+    async def _scan_loop(self):
+        """Producer: scan on each new block, or on a timer without WS"""
+        if self.arbitrage_engine.ws_url:
+            try:
+                await self._scan_on_new_heads()
+                return
+            except Exception as e:
+                logger.warning(f"newHeads subscription unavailable, polling instead: {e}")
+
         while self.is_running:
             try:
-                # Find opportunities
-                triangular_opps = await self.arbitrage_engine.find_triangular_opportunities(min_profit=10)
-                cross_dex_opps = await self.arbitrage_engine.find_cross_dex_opportunities("USDC-USDT", min_profit=20)
-                
-                # Execute best opportunity
-                all_opps = triangular_opps + cross_dex_opps
-                if all_opps:
-                    best = max(all_opps, key=lambda x: x.expected_profit)
-                    
-                    if best.expected_profit > 0:
-                        logger.info(f"Found opportunity: ${best.expected_profit:.2f}")
-                        result = await self.arbitrage_engine.execute_arbitrage(best)
-                        logger.info(f"Result: {result}")
-                
+                await self._scan_once()
                 await asyncio.sleep(self.check_interval)
-                
             except Exception as e:
                 logger.error(f"Trading loop error: {e}")
                 await asyncio.sleep(10)
-    
+
+    async def _scan_on_new_heads(self):
+        """Scan immediately after each block instead of on a fixed timer"""
+        w3 = AsyncWeb3(WebSocketProvider(self.arbitrage_engine.ws_url))
+        # Bound the connect - the provider otherwise retries with backoff
+        # forever and the polling fallback would never engage
+        await asyncio.wait_for(w3.provider.connect(), timeout=10)
+        await w3.eth.subscribe("newHeads")
+        logger.info("Scanning on newHeads events")
+
+        async for _header in w3.socket.process_subscriptions():
+            if not self.is_running:
+                break
+            try:
+                await self._scan_once()
+            except Exception as e:
+                logger.error(f"Trading loop error: {e}")
+
+    async def _scan_once(self):
+        """One scan cycle: find opportunities and enqueue the best one"""
+        triangular_opps = await self.arbitrage_engine.find_triangular_opportunities(min_profit=10)
+        cross_dex_opps = await self.arbitrage_engine.find_cross_dex_opportunities("USDC-USDT", min_profit=20)
+
+        all_opps = triangular_opps + cross_dex_opps
+        if all_opps:
+            best = max(all_opps, key=lambda x: x.expected_profit)
+
+            if best.expected_profit > 0:
+                logger.info(f"Found opportunity: ${best.expected_profit:.2f}")
+                if self.opp_queue.full():
+                    self.opp_queue.get_nowait()  # Drop oldest
+                self.opp_queue.put_nowait(best)
+
+    async def _execute_loop(self):
+        """Consumer: execute queued opportunities, one tx in flight at a time"""
+        while self.is_running:
+            try:
+                best = await asyncio.wait_for(self.opp_queue.get(), timeout=1)
+            except asyncio.TimeoutError:
+                continue  # Re-check is_running
+
+            try:
+                result = await self.arbitrage_engine.execute_arbitrage(best)
+                logger.info(f"Result: {result}")
+            except Exception as e:
+                logger.error(f"Execution error: {e}")
+
     def stop(self):
         self.is_running = False
         logger.info("🛑 Production trading stopped")
@@ -3,19 +3,55 @@ Multi-Chain Support - BSC, Arbitrum, Optimism, Polygon
 Less competition = more profit!
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from dataclasses import dataclass
-from web3 import Web3
+import aiohttp
+import numpy as np
+from eth_abi import decode as abi_decode, encode as abi_encode
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+from web3.providers.rpc import AsyncHTTPProvider
 import asyncio
+import functools
+import logging
+import time
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Selector for getAmountsOut(uint256,address[])
+_GETAMOUNTSOUT_SELECTOR = bytes.fromhex("d06ca61f")
+
+# Prices are carried internally as integer micro-USD: exact comparisons,
+# no float rounding hazards when ranking chains
+_MICRO_USD = 1_000_000
+
+
+def _checksum_routers(dexes: Mapping[str, str]) -> tuple:
+    """Checksum a chain's router addresses once, dropping malformed entries
+
+    to_checksum_address runs Keccak-256 - doing it per quote repeated the
+    hash for the same string constants on every cycle.
+    """
+    routers = []
+    for router in dexes.values():
+        try:
+            routers.append(Web3.to_checksum_address(router.lower()))
+        except ValueError:
+            continue
+    return tuple(routers)
+
+
+@dataclass(frozen=True, slots=True)
 class ChainConfig:
     name: str
     chain_id: int
     rpc: str
-    explorers: List[str]
-    dexes: Dict[str, str]
+    explorers: tuple
+    dexes: Mapping[str, str]
+    # WETH/USDC pair used for the canonical ETH price on this chain
+    weth: str = ""
+    usdc: str = ""
+    usdc_decimals: int = 6
 
 
 class MultiChainArbitrage:
@@ -27,117 +63,436 @@ class MultiChainArbitrage:
             name="Ethereum",
             chain_id=1,
             rpc="",
-            explorers=["https://etherscan.io"],
-            dexes={
+            explorers=("https://etherscan.io",),
+            dexes=MappingProxyType({
                 "uniswap_v2": "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",
                 "uniswap_v3": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
                 "sushiswap": "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F",
-            }
+            }),
+            weth="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+            usdc="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
         ),
         "arbitrum": ChainConfig(
             name="Arbitrum One",
             chain_id=42161,
             rpc="",
-            explorers=["https://arbiscan.io"],
-            dexes={
+            explorers=("https://arbiscan.io",),
+            dexes=MappingProxyType({
                 "uniswap_v3": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
                 "sushiswap": "0x1b02dA8Cb0d097eB8D57A175b88c7D8b47997506",
                 "camelot": "0xc873fEcBd354F25A9CC2a8A0f543E9F8c64c3C05",
-            }
+            }),
+            weth="0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
+            usdc="0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8",
         ),
         "optimism": ChainConfig(
             name="Optimism",
             chain_id=10,
             rpc="",
-            explorers=["https://optimistic.etherscan.io"],
-            dexes={
+            explorers=("https://optimistic.etherscan.io",),
+            dexes=MappingProxyType({
                 "uniswap_v3": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
                 "sushiswap": "0x4B4445D5b723b1b73f72B2F9253D0eC4B8e42a2f",
                 "velodrome": "0x3Ac6b2A24D5E08A67c2D66eD1A5E2B9c5c1Aa2b",
-            }
+            }),
+            weth="0x4200000000000000000000000000000000000006",
+            usdc="0x7F5c764cBc14f9669B88837ca1490cCa17c31607",
         ),
         "polygon": ChainConfig(
             name="Polygon",
             chain_id=137,
             rpc="",
-            explorers=["https://polygonscan.com"],
-            dexes={
+            explorers=("https://polygonscan.com",),
+            dexes=MappingProxyType({
                 "quickswap": "0xa5E0829CaCEd8fFDD4De3c43696c1767C07C0d4",
                 "sushiswap": "0x1b02dA8Cb0d097eB8D57A175b88c7D8b47997506",
                 "uniswap_v3": "0xE592427A0AEce92De3Edee1F18E0157C05861564",
-            }
+            }),
+            weth="0x7ceB23fD6bC0adD59E62ac25578270cFf1b9f619",
+            usdc="0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174",
         ),
         "bsc": ChainConfig(
             name="BNB Smart Chain",
             chain_id=56,
             rpc="",
-            explorers=["https://bscscan.com"],
-            dexes={
+            explorers=("https://bscscan.com",),
+            dexes=MappingProxyType({
                 "pancakeswap": "0x10ED43C718714eb63d5aA57B78B54704E256024E",
                 "biswap": "0x3a6d15c0D1517E1a3D64f8b80f7E8C8d4c1EaC7",
                 "apeswap": "0xcF0feBd3Fe17f8C1bf3C0E3b1b2E89A6c9b3e1C",
-            }
+            }),
+            weth="0x2170Ed0880ac9A755fd29B2688956BD959F933F8",
+            usdc="0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d",
+            usdc_decimals=18,  # BSC stables are 18-decimal
         ),
     }
     
+    # Price cache TTLs roughly matching each chain's block time
+    PRICE_TTL = {
+        "ethereum": 12,
+        "arbitrum": 0.5,
+        "optimism": 2,
+        "polygon": 2,
+        "bsc": 3,
+    }
+    PRICE_TTL_DEFAULT = 2
+
+    # Default bridge + gas cost assumed per cross-chain round trip (USD)
+    BRIDGE_COST_DEFAULT = 30.0
+
     def __init__(self, rpc_urls: Dict[str, str]):
         self.rpc_urls = rpc_urls
-        self.web3_instances = {}
+
+        # One pooled keep-alive HTTP session per endpoint, reused across
+        # polling cycles so each batch skips the TCP+TLS handshake
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+        # TTL price cache - prices only move per block, so chains polled
+        # faster than their block time are served from memory
+        self._price_cache: Dict[str, tuple] = {}  # chain -> (price, monotonic ts)
+
+        # Optional newHeads workers keyed by chain (see start_price_workers)
+        self._workers: Dict[str, asyncio.Task] = {}
+
+        # Router addresses checksummed once up front - one Keccak per
+        # address at construction instead of one per quote
+        self._routers: Dict[str, tuple] = {
+            name: _checksum_routers(config.dexes)
+            for name, config in self.CHAINS.items()
+        }
+
+        # Estimated bridging cost per (buy_chain, sell_chain) route in USD,
+        # refreshable at runtime; routes not listed use the default
+        self._bridge_cost_estimate: Dict[tuple, float] = {}
+
+        # Failure tracking: a dead RPC is skipped entirely until its
+        # exponential-backoff cooldown expires instead of paying a
+        # connect timeout on every poll
+        self._cooldowns: Dict[str, float] = {}
+        self._fail_counts: Dict[str, int] = {}
+
+        # Chains with an RPC configured, pre-filtered and flattened once so
+        # the per-poll loop is a tight iteration over plain tuples instead
+        # of dict lookups and membership checks every cycle
+        self._active = tuple(
+            (name, self.PRICE_TTL.get(name, self.PRICE_TTL_DEFAULT), config)
+            for name, config in self.CHAINS.items()
+            if name in rpc_urls
+        )
         
-    def connect_chain(self, chain_name: str) -> Web3:
-        """Connect to a specific chain"""
-        if chain_name not in self.rpc_urls:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_w3(url: str) -> AsyncWeb3:
+        """Provider factory cached per URL, so an RPC failover/rotation
+        gets a fresh pooled connection instead of a stale cached one"""
+        return AsyncWeb3(AsyncHTTPProvider(url, request_kwargs={"timeout": 10}))
+
+    def connect_chain(self, chain_name: str) -> AsyncWeb3:
+        """Connect to a specific chain
+
+        Uses AsyncHTTPProvider so RPC I/O yields to the event loop and the
+        concurrent per-chain gather actually overlaps. Providers are cached
+        by URL, not chain name - swap rpc_urls and the next call connects
+        to the new endpoint.
+        """
+        urls = self._urls_for(chain_name)
+        if not urls:
             raise ValueError(f"No RPC URL for {chain_name}")
-        
-        if chain_name not in self.web3_instances:
-            self.web3_instances[chain_name] = Web3(Web3.HTTPProvider(self.rpc_urls[chain_name]))
-        
-        return self.web3_instances[chain_name]
+
+        return self._build_w3(urls[0])
     
     async def find_cross_chain_opportunities(self) -> List[Dict]:
         """Find arbitrage between chains"""
         opportunities = []
-        
-        # Compare ETH price across chains
+
+        # Compare ETH price across chains - query all chains concurrently
+        # so wall time is one round-trip, not the sum over chains
         eth_prices = {}
-        
-        for chain_name, config in self.CHAINS.items():
-            try:
-                if chain_name in self.rpc_urls:
-                    w3 = self.connect_chain(chain_name)
-                    # Get ETH price on this chain
-                    # Simplified - use USDC pair
-                    price = await self._get_eth_price(w3, config)
-                    if price:
-                        eth_prices[chain_name] = price
-            except Exception as e:
+
+        now = time.monotonic()
+        tasks = {}
+        for chain_name, ttl, config in self._active:
+            # Serve from the TTL cache while the chain's block time says
+            # the price cannot have moved yet
+            cached = self._price_cache.get(chain_name)
+            if cached is not None:
+                price, fetched_at = cached
+                if now - fetched_at < ttl:
+                    eth_prices[chain_name] = price
+                    continue
+
+            # Dead chain still cooling down - skip without I/O
+            if now < self._cooldowns.get(chain_name, 0):
                 continue
+
+            # Get ETH price on this chain
+            # Simplified - use USDC pair
+            tasks[chain_name] = asyncio.create_task(
+                self._get_eth_price(chain_name, config)
+            )
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for chain_name, price in zip(tasks, results):
+            if isinstance(price, Exception):
+                fails = self._fail_counts.get(chain_name, 0) + 1
+                self._fail_counts[chain_name] = fails
+                self._cooldowns[chain_name] = time.monotonic() + min(60, 2 ** fails)
+                logger.info(
+                    f"{chain_name} price fetch failed ({fails}x, backing off): {price}"
+                )
+                continue
+            if not price:
+                continue
+            self._fail_counts.pop(chain_name, None)
+            eth_prices[chain_name] = price
+            self._price_cache[chain_name] = (price, now)
         
-        # Find price differences
-        if len(eth_prices) >= 2:
-            prices = list(eth_prices.values())
-            min_price = min(prices)
-            max_price = max(prices)
-            
-            if max_price - min_price > 10:  # > $10 difference
-                for chain, price in eth_prices.items():
-                    if price == min_price:
-                        opportunities.append({
-                            "type": "cross_chain",
-                            "buy_chain": chain,
-                            "sell_chain": [c for c, p in eth_prices.items() if p == max_price][0],
-                            "profit_estimate": max_price - min_price,
-                            "token": "ETH"
-                        })
-        
+        # Find price differences. Exactly two chains is the common shape -
+        # short-circuit it with a direct unpack; larger sets go through the
+        # vectorized (token, chain) spread search, which scales to many
+        # tokens with the same C-level reductions
+        if len(eth_prices) < 2:
+            return opportunities
+
+        if len(eth_prices) == 2:
+            (chain1, price1), (chain2, price2) = eth_prices.items()
+            spread = abs(price1 - price2)
+            candidates = []
+            if spread > 10 * _MICRO_USD:  # > $10 difference
+                buy, sell = (chain1, chain2) if price1 < price2 else (chain2, chain1)
+                candidates.append({
+                    "type": "cross_chain",
+                    "buy_chain": buy,
+                    "sell_chain": sell,
+                    "profit_estimate": spread / _MICRO_USD,
+                    "token": "ETH",
+                })
+        else:
+            chains = tuple(eth_prices)
+            matrix = np.array([[eth_prices[c] for c in chains]], dtype=np.float64)
+            candidates = self._vectorized_spreads(matrix, ("ETH",), chains)
+
+        for opp in candidates:
+            # Prune candidates that don't survive bridging costs before
+            # anything downstream spends a bridge-quote RPC on them
+            route = (opp["buy_chain"], opp["sell_chain"])
+            net = opp["profit_estimate"] - self._bridge_cost_estimate.get(
+                route, self.BRIDGE_COST_DEFAULT
+            )
+            if net <= 0:
+                continue
+            opp["net_profit"] = net
+            opportunities.append(opp)
+
         return opportunities
+
+    def set_bridge_cost(self, buy_chain: str, sell_chain: str, cost_usd: float):
+        """Update the bridging cost estimate for a route (e.g. from a side task)"""
+        self._bridge_cost_estimate[(buy_chain, sell_chain)] = cost_usd
+
+    @staticmethod
+    def _vectorized_spreads(
+        prices: "np.ndarray",
+        tokens: tuple,
+        chains: tuple,
+        threshold: int = 10 * _MICRO_USD
+    ) -> List[Dict]:
+        """Spread search over a (token, chain) price matrix in micro-USD
+
+        One set of NumPy reductions computes every token's spread and its
+        buy/sell chains at once; missing prices are NaN and ignored.
+        """
+        spreads = np.nanmax(prices, axis=1) - np.nanmin(prices, axis=1)
+        hits = np.where(spreads > threshold)[0]
+        if hits.size == 0:
+            return []
+
+        buy_idx = np.nanargmin(prices[hits], axis=1)
+        sell_idx = np.nanargmax(prices[hits], axis=1)
+
+        return [
+            {
+                "type": "cross_chain",
+                "buy_chain": chains[buy],
+                "sell_chain": chains[sell],
+                # Reported in USD for callers
+                "profit_estimate": float(spreads[t]) / _MICRO_USD,
+                "token": tokens[t],
+            }
+            for t, buy, sell in zip(hits, buy_idx, sell_idx)
+        ]
     
-    async def _get_eth_price(self, web3: Web3, config: ChainConfig) -> float:
-        """Get ETH price on a chain (simplified)"""
-        # In production: query actual DEX pairs
-        # Return placeholder
-        return 0
+    # Minimal router ABI for getAmountsOut quotes
+    ROUTER_ABI = [
+        {
+            "inputs": [{"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+                       {"internalType": "address[]", "name": "path", "type": "address[]"}],
+            "name": "getAmountsOut",
+            "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+            "stateMutability": "view", "type": "function"
+        }
+    ]
+
+    def _urls_for(self, chain_name: str) -> tuple:
+        """RPC URLs for a chain - accepts a single URL or a list of them"""
+        urls = self.rpc_urls.get(chain_name)
+        if urls is None:
+            return ()
+        if isinstance(urls, str):
+            return (urls,)
+        return tuple(urls)
+
+    async def _get_eth_price(self, chain_name: str, config: ChainConfig) -> int:
+        """Get the ETH price on a chain in integer micro-USD
+
+        With several RPC URLs configured for the chain, the endpoints are
+        raced and the first response wins - hedging the long-tail latency
+        of public RPCs down to roughly the fleet's median.
+        """
+        urls = self._urls_for(chain_name)
+        if not urls:
+            return 0
+
+        if len(urls) == 1:
+            return await self._fetch_chain_price(urls[0], chain_name, config)
+
+        pending = {
+            asyncio.create_task(self._fetch_chain_price(url, chain_name, config))
+            for url in urls
+        }
+        try:
+            # First *successful* response wins; a fast connection-refused
+            # from a dead endpoint must not cancel the healthy ones
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED, timeout=2.0
+                )
+                if not done:
+                    break  # Timed out with no completions
+                for task in done:
+                    if task.exception() is None and task.result() > 0:
+                        return task.result()
+            return 0
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_chain_price(
+        self, endpoint: str, chain_name: str, config: ChainConfig
+    ) -> int:
+        """One batched quote request against a single endpoint
+
+        Quotes 1 WETH -> USDC on every router of the chain in a single
+        JSON-RPC batch request - one HTTP round-trip per chain regardless
+        of how many DEXes it lists - and returns the median quote.
+        """
+        routers = self._routers.get(chain_name, ())
+        if not routers or not config.weth or not config.usdc:
+            return 0
+
+        calldata = "0x" + (
+            _GETAMOUNTSOUT_SELECTOR
+            + abi_encode(["uint256", "address[]"], [10 ** 18, [config.weth, config.usdc]])
+        ).hex()
+
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [{"to": router, "data": calldata}, "latest"],
+            }
+            for i, router in enumerate(routers)
+        ]
+
+        session = self._session_for(endpoint)
+        async with session.post(
+            endpoint, json=batch, timeout=aiohttp.ClientTimeout(total=10)
+        ) as resp:
+            responses = await resp.json()
+
+        if isinstance(responses, dict):
+            responses = [responses]
+
+        scale = 10 ** config.usdc_decimals
+        quotes = []
+        for item in responses:
+            result = item.get("result")
+            if not result or result == "0x":
+                continue
+            try:
+                (amounts,) = abi_decode(["uint256[]"], bytes.fromhex(result[2:]))
+            except Exception:
+                continue
+            if len(amounts) > 1 and amounts[1] > 0:
+                # Integer micro-USD, no float division
+                quotes.append(amounts[1] * _MICRO_USD // scale)
+
+        if not quotes:
+            return 0
+        quotes.sort()
+        return quotes[len(quotes) // 2]  # Median across the chain's DEXes
     
+    def start_price_workers(self, wss_urls: Dict[str, str]):
+        """Start per-chain newHeads workers that keep the price cache warm
+
+        With workers running, find_cross_chain_opportunities becomes pure
+        in-memory math - prices refresh exactly once per block instead of
+        being polled on a timer.
+        """
+        for chain_name, _ttl, config in self._active:
+            wss = wss_urls.get(chain_name)
+            if wss and chain_name not in self._workers:
+                self._workers[chain_name] = asyncio.create_task(
+                    self._price_worker(chain_name, wss, config)
+                )
+
+    def stop_price_workers(self):
+        """Cancel all running price workers"""
+        for task in self._workers.values():
+            task.cancel()
+        self._workers.clear()
+
+    async def _price_worker(self, chain_name: str, wss_url: str, config: ChainConfig):
+        """Refresh one chain's cached price on every new block head"""
+        while True:
+            try:
+                w3 = AsyncWeb3(WebSocketProvider(wss_url))
+                await asyncio.wait_for(w3.provider.connect(), timeout=10)
+                await w3.eth.subscribe("newHeads")
+
+                async for _header in w3.socket.process_subscriptions():
+                    price = await self._get_eth_price(chain_name, config)
+                    if price > 0:
+                        self._price_cache[chain_name] = (price, time.monotonic())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"{chain_name} price worker reconnecting: {e}")
+                await asyncio.sleep(5)
+
+    def _session_for(self, url: str) -> aiohttp.ClientSession:
+        """Get (or lazily create) the pooled session for an endpoint"""
+        session = self._sessions.get(url)
+        if session is None or session.closed:
+            # Sized for full fan-out: every chain batching all of its DEX
+            # quotes concurrently must not queue on the connector
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64, limit_per_host=32, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+            self._sessions[url] = session
+        return session
+
+    async def close(self):
+        """Close pooled HTTP sessions for graceful shutdown"""
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
     def get_available_chains(self) -> List[str]:
         """Get list of chains with RPC configured"""
         return list(self.rpc_urls.keys())
@@ -17,17 +17,291 @@ Strategies:
 """
 
 import asyncio
+import collections
 import logging
+import os
 import time
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import functools
+import itertools
 import math
+import json
+from heapq import nlargest
+from operator import attrgetter
 
+_PROFIT_KEY = attrgetter("expected_profit")
+
+import aiohttp
 import numpy as np
+from eth_abi import decode as abi_decode, encode as abi_encode
+from eth_utils import keccak, to_checksum_address
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import Web3Exception
+from web3.providers.rpc import AsyncHTTPProvider
+
+from .indicators import PriceHistory, StreamingEMA, macd_batch, pair_spreads, tri_profits
 
 logger = logging.getLogger(__name__)
 
+# Interval checks use the monotonic clock - wall time can jump with NTP
+_DAY_SECONDS = 86400
+
+# Exceptions a flaky RPC endpoint actually raises on the read path;
+# anything else is a programming error and should surface
+RPC_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, OSError, Web3Exception, ValueError)
+
+
+class RPCDegradedError(RuntimeError):
+    """Raised when the RPC endpoint fails often enough to abort a scan"""
+
+
+# Optional: Numba-compiled candidate enumeration (pure-python fallback below)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Multicall3 (same address on all major chains) - collapses N eth_calls
+# into one aggregate3 round-trip
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+_GETRESERVES_CALLDATA = bytes.fromhex("0902f1ac")  # getReserves()
+_GETPOOL_SELECTOR = bytes.fromhex("1698ee82")  # getPool(address,address,uint24)
+
+# V3 fee tiers probed when discovering a pool
+V3_FEE_TIERS = (3000, 500, 10000)
+
+# CoinGecko id mapping shared by every scanner that falls back to the API
+COINGECKO_IDS = {
+    "ETH": "ethereum", "WETH": "ethereum", "WBTC": "wrapped-bitcoin",
+    "BTC": "bitcoin", "USDC": "usd-coin", "USDT": "tether", "DAI": "dai",
+    "LINK": "chainlink", "UNI": "uniswap", "AAVE": "aave",
+    "CRV": "curve-dao-token", "SUSHI": "sushi", "SNX": "havven",
+    "COMP": "compound-governance-token", "MKR": "maker",
+    "MATIC": "matic-network", "LDO": "lido-dao", "OP": "optimism",
+    "ARB": "arbitrum", "GMX": "gmx", "RNDR": "render-token",
+}
+
+# Last-resort fallback prices, frozen at import - this lookup runs for
+# every quote whose on-chain and API paths both failed, and rebuilding
+# the literal dict per call was pure allocator churn
+_FALLBACK_PRICES = {
+    ("ETH", "USDC"): 2000.0, ("WETH", "USDC"): 2000.0,
+    ("WBTC", "USDC"): 42000.0, ("LINK", "USDC"): 15.0,
+    ("UNI", "USDC"): 7.0, ("AAVE", "USDC"): 100.0,
+    ("USDC", "USDT"): 1.0, ("DAI", "USDC"): 1.0,
+}
+
+# Mainnet token addresses, built once at import
+TOKEN_ADDRESSES = {
+    "ETH": "0x0000000000000000000000000000000000000000",
+    "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+    "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+    "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+    "DAI": "0x6B175474E89094C44Da98b954EesADeF9D188B8",  # Fixed typo
+    "WBTC": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
+    "LINK": "0x514910771AF9Ca656af840dff83E8264EcF986CA",
+    "UNI": "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984",
+    "AAVE": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
+    "CRV": "0xD533a949740bb3306d119CC777fa900bA034cd52",
+    "SUSHI": "0x6B3595068778DD592e39A122f4f5a5cF09C90fE2",
+    "SNX": "0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F",
+    "COMP": "0xc00e94Cb662C3520282E6f5717214004A7f26888",
+    "MKR": "0x9f8F72aA9304c8B593d555F12eF6589cC3B57965",
+    "MATIC": "0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeeb0",
+    "LDO": "0x5A98FcBEA4Cf5422B8948a6e3f2eF3A92dF8B80",
+    "OP": "0x4200000000000000000000000000000000000006",
+    "ARB": "0x912CE59144191C1204E61159e7a6E8fA17F5A95A",
+    "STETH": "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84",
+    "RETH": "0xae78736Cd615f374D3085123A210169E74C93BE9",
+    "GMX": "0xfc5A1A6EB076a2C7ad06e22dc90D6F1F6bb62e53",
+    "RNDR": "0x5282F1B197fF2e3B72D84b9061D9c8D53E0a4F1F",
+}
+
+# Factory / pool addresses and ABIs, parsed once at import instead of
+# per call inside the scan loops
+UNIV2_FACTORY_ADDRESS = Web3.to_checksum_address(
+    "0x5C69bEe701ef814a2B6fe3cF77eE1eD5e2b3f2c4".lower()
+)
+UNIV3_FACTORY_ADDRESS = Web3.to_checksum_address(
+    "0x1F98431c8aD98523631AE4a59f267346ea31F984".lower()
+)
+SUSHISWAP_FACTORY_ADDRESS = Web3.to_checksum_address(
+    "0xC0AEe478e3658e2610c5F7A4A2E1777cE9e4f2Ac".lower()
+)
+
+def async_ttl_cache(ttl: float, symmetric_pair: bool = False):
+    """TTL memoization for async methods, keyed on their arguments
+
+    Cached per instance with a monotonic-clock expiry; None results are
+    not cached so transient failures retry. symmetric_pair canonicalizes
+    the first two (token) arguments, since a pool is the same object in
+    both trade directions.
+    """
+    def wrap(fn):
+        attr = f"_ttl_{fn.__name__}"
+
+        @functools.wraps(fn)
+        async def inner(self, *args):
+            cache = getattr(self, attr, None)
+            if cache is None:
+                cache = {}
+                setattr(self, attr, cache)
+
+            key = args
+            if symmetric_pair and len(args) >= 2:
+                a, b = args[0], args[1]
+                if isinstance(a, str) and isinstance(b, str) and a.lower() > b.lower():
+                    key = (b, a) + args[2:]
+
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now < hit[1]:
+                return hit[0]
+
+            value = await fn(self, *args)
+            if value is not None:
+                cache[key] = (value, now + ttl)
+            return value
+
+        return inner
+    return wrap
+
+
+def _screen_candidates_np(P: "np.ndarray", min_diff: float) -> "np.ndarray":
+    """NumPy fallback: full broadcast diff tensor + argwhere"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        diff = np.abs(P[:, :, :, None] - P[:, :, None, :]) / np.minimum(
+            P[:, :, :, None], P[:, :, None, :]
+        )
+    return np.argwhere(diff >= min_diff)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _screen_candidates_nb(P, min_diff):  # pragma: no cover - needs numba
+        T, _, E = P.shape
+        idx = np.empty((T * T * E * E, 4), np.int32)
+        n = 0
+        for i in range(T):
+            for j in range(T):
+                for e1 in range(E):
+                    p1 = P[i, j, e1]
+                    if p1 != p1 or p1 <= 0:  # NaN or unusable
+                        continue
+                    for e2 in range(e1 + 1, E):
+                        p2 = P[i, j, e2]
+                        if p2 != p2 or p2 <= 0:
+                            continue
+                        lo = p1 if p1 < p2 else p2
+                        d = p1 - p2 if p1 > p2 else p2 - p1
+                        if d / lo >= min_diff:
+                            idx[n, 0] = i
+                            idx[n, 1] = j
+                            idx[n, 2] = e1
+                            idx[n, 3] = e2
+                            n += 1
+        return idx[:n]
+else:
+    _screen_candidates_nb = None
+
+
+def screen_price_matrix(P: "np.ndarray", min_diff: float) -> "np.ndarray":
+    """Enumerate (token, token, ex1, ex2) indices clearing min_diff
+
+    Uses the compiled Numba kernel when available (no T^2*E^2 temporary
+    tensor); otherwise the vectorized NumPy broadcast.
+    """
+    if _screen_candidates_nb is not None:
+        return _screen_candidates_nb(P, min_diff)
+    return _screen_candidates_np(P, min_diff)
+
+
+@functools.lru_cache(maxsize=256)
+def _confidence_for_diff(price_diff: float) -> float:
+    """Confidence lookup for a binned price diff"""
+    if price_diff >= 0.005:  # OPTIMAL_PRICE_DIFF
+        return 0.95
+    elif price_diff >= 0.003:
+        return 0.85
+    elif price_diff >= 0.002:
+        return 0.75
+    else:
+        return 0.6
+
+
+@functools.lru_cache(maxsize=64)
+def exchange_kind(exchange: str) -> str:
+    """Classify an exchange id as 'v3' or 'v2'-style, computed once
+
+    The scan loops ran these substring checks on every iteration; the
+    lru_cache turns them into a dict hit per exchange id.
+    """
+    if "v3" in exchange:
+        return "v3"
+    if "uniswap_v2" in exchange or "sushi" in exchange:
+        return "v2"
+    return ""
+
+
+@functools.lru_cache(maxsize=64)
+def exchange_fee_tier(exchange: str) -> int:
+    """Fee tier used when building swap data for an exchange"""
+    return 3000 if exchange_kind(exchange) == "v3" else 300
+
+
+# CREATE2 init code hashes - pair addresses are deterministic, so they
+# can be derived locally with two keccaks instead of a getPair RPC
+UNIV2_INIT_CODE_HASH = "96e8ac4277198ff8b6f785478aa9a39f403cb768dd02cbee326c3e7da348845f"
+SUSHISWAP_INIT_CODE_HASH = "e18a34eb0e04b04f7a0ac29a6e80748dca96319b42c54d679cb821dca90c6303"
+
+
+@functools.lru_cache(maxsize=4096)
+def compute_v2_pair_address(
+    token_a: str, token_b: str, factory: str, init_code_hash: str
+) -> str:
+    """Derive a Uniswap V2-style pair address via CREATE2 - no RPC
+
+    address = keccak256(0xff ++ factory ++ keccak256(token0 ++ token1)
+    ++ init_code_hash)[12:]
+    """
+    token0, token1 = sorted((token_a.lower(), token_b.lower()))
+    salt = keccak(bytes.fromhex(token0[2:]) + bytes.fromhex(token1[2:]))
+    raw = keccak(
+        b"\xff"
+        + bytes.fromhex(factory[2:].lower())
+        + salt
+        + bytes.fromhex(init_code_hash)
+    )
+    return to_checksum_address(raw[12:])
+
+
+UNIV2_FACTORY_ABI = json.loads(
+    '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},'
+    '{"name":"tokenB","type":"address"}],"name":"getPair",'
+    '"outputs":[{"name":"pair","type":"address"}],"type":"function"}]'
+)
+UNIV3_FACTORY_ABI = json.loads(
+    '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},'
+    '{"name":"tokenB","type":"address"},{"name":"fee","type":"uint24"}],'
+    '"name":"getPool","outputs":[{"name":"pool","type":"address"}],"type":"function"}]'
+)
+UNIV2_PAIR_ABI = json.loads(
+    '[{"constant":true,"inputs":[],"name":"getReserves",'
+    '"outputs":[{"name":"reserve0","type":"uint112"},{"name":"reserve1","type":"uint112"},'
+    '{"name":"blockTimestampLast","type":"uint32"}],"type":"function"}]'
+)
+UNIV3_POOL_ABI = json.loads(
+    '[{"constant":true,"inputs":[],"name":"slot0",'
+    '"outputs":[{"name":"sqrtPriceX96","type":"uint160"},{"name":"tick","type":"int24"},'
+    '{"name":"observationIndex","type":"uint16"},{"name":"observationCardinality","type":"uint16"},'
+    '{"name":"observationCardinalityNext","type":"uint16"},{"name":"feeProtocol","type":"uint8"},'
+    '{"name":"unlocked","type":"bool"}],"type":"function"}]'
+)
+
+
 
 class TradingStrategy(Enum):
     """Trading strategy types"""
@@ -43,7 +317,19 @@ class TradingStrategy(Enum):
     ML = "ml"
 
 
-@dataclass
+class ArbIndicators(NamedTuple):
+    """Arbitrage signal indicators - fixed tuple layout instead of a dict
+
+    Thousands of these are allocated per scan; a NamedTuple is one small
+    tuple versus a dict with hashed key lookups per field.
+    """
+    price_diff: float
+    exchange_1: str
+    exchange_2: str
+    price_impact: float
+
+
+@dataclass(slots=True)
 class TradeSignal:
     """Trading signal with COMPLETE swap data"""
     # Strategy
@@ -83,8 +369,9 @@ class TradeSignal:
     timeframe: str = ""
     expires_at: float = 0.0
     
-    # Additional data
-    indicators: Dict = field(default_factory=dict)
+    # Additional data (dict for most strategies, ArbIndicators for the
+    # high-volume arbitrage scanner)
+    indicators: Any = field(default_factory=dict)
     
     def validate(self) -> bool:
         """Validate signal has all required swap fields"""
@@ -118,7 +405,7 @@ class TradeSignal:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """Trade execution result"""
     success: bool
@@ -129,6 +416,16 @@ class TradeResult:
     execution_time: float
     details: Dict
 
+    @property
+    def signal_dict(self) -> Optional[Dict]:
+        """Dict form of the executed signal, materialized on demand
+
+        details carries the TradeSignal by reference on the hot path;
+        callers that need a serializable copy take it from here.
+        """
+        signal = self.details.get("signal")
+        return signal.to_dict() if isinstance(signal, TradeSignal) else None
+
 
 class AggressiveArbitrageScanner:
     """
@@ -143,7 +440,17 @@ class AggressiveArbitrageScanner:
     def __init__(self, config: Dict):
         self.config = config
         self.min_profit = config.get("min_profit_per_trade", 200)
+        self.loan_amount = config.get("loan_amount", 75000)
+        self.max_concurrent_trades = config.get("max_concurrent_trades", 15)
         self.max_slippage = config.get("max_slippage", 0.015)
+
+        # Token/exchange universes interned to int indices once - config
+        # is immutable at runtime, so the hot loops index the price
+        # tensor through these instead of rebuilding maps per scan
+        self._tokens = tuple(config.get("tokens", []))
+        self._exchanges = tuple(config.get("exchanges", []))
+        self._token_idx = {token: i for i, token in enumerate(self._tokens)}
+        self._ex_idx = {ex: i for i, ex in enumerate(self._exchanges)}
         
         # Historical price data for analysis
         self.price_history: Dict[str, List[float]] = {}
@@ -151,192 +458,408 @@ class AggressiveArbitrageScanner:
         
         # Exchange prices cache
         self.exchange_prices: Dict[str, Dict[str, float]] = {}
-        
+
+        # Persistent async provider + shared HTTP session: one connection
+        # pool for the whole scanner instead of a fresh TCP+TLS handshake
+        # per call, and contract calls that yield to the event loop
+        self._rpc_url = os.getenv("ETHEREUM_RPC_URL", "http://localhost:8545")
+        self._w3 = AsyncWeb3(
+            AsyncHTTPProvider(self._rpc_url, request_kwargs={"timeout": 5})
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Per-scan RPC failure accounting - a degraded endpoint aborts the
+        # scan early instead of silently degrading every quote to fallbacks
+        self._rpc_failures: collections.Counter = collections.Counter()
+
+        # Contract objects cached per address - construction re-runs ABI
+        # codec setup every time, which adds up inside the scan loops
+        self._pair_contracts: Dict[str, Any] = {}
+        self._v3_pool_contracts: Dict[str, Any] = {}
+
 
     async def scan_arbitrage_opportunities(self) -> List[TradeSignal]:
-        """Scan for cross-exchange arbitrage opportunities with COMPLETE swap data"""
-        import os
-        from web3 import Web3
-        
+        """Scan for cross-exchange arbitrage opportunities with COMPLETE swap data
+
+        Two-phase scan: phase 1 fires every (token_in, token_out, exchange)
+        price query in one bounded gather, phase 2 only spends pool/
+        liquidity/amount RPCs on pairs that clear MIN_PRICE_DIFF.
+        """
         opportunities = []
-        rpc_url = os.getenv("ETHEREUM_RPC_URL", "http://localhost:8545")
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        
-        tokens = self.config.get("tokens", [])
-        exchanges = self.config.get("exchanges", [])
-        amount = self.config.get("loan_amount", 75000)
-        
+        w3 = self._w3
+
+        tokens = self._tokens
+        exchanges = self._exchanges
+        amount = self.loan_amount
+
         # Get token addresses
         token_addresses = self._get_token_addresses()
-        
-        # Check all token pairs across all exchanges
-        for token_in in tokens:
-            for token_out in tokens:
-                if token_in == token_out:
-                    continue
-                    
-                for ex1 in exchanges:
-                    for ex2 in exchanges:
-                        if ex1 == ex2:
-                            continue
-                        
-                        # Get prices from both exchanges
-                        price1 = await self._get_price(token_in, token_out, ex1)
-                        price2 = await self._get_price(token_in, token_out, ex2)
-                        
-                        if price1 and price2:
-                            # Calculate price difference
-                            diff = abs(price1 - price2) / min(price1, price2)
-                            
-                            if diff >= self.MIN_PRICE_DIFF:
-                                # Get pool data for BOTH exchanges
-                                pool1_addr = await self._get_pool_address(
-                                    token_addresses.get(token_in.upper(), ""),
-                                    token_addresses.get(token_out.upper(), ""),
-                                    ex1, w3
-                                )
-                                pool2_addr = await self._get_pool_address(
-                                    token_addresses.get(token_in.upper(), ""),
-                                    token_addresses.get(token_out.upper(), ""),
-                                    ex2, w3
-                                )
-                                
-                                liquidity1 = await self._get_pool_liquidity(pool1_addr, w3) if pool1_addr else 0
-                                liquidity2 = await self._get_pool_liquidity(pool2_addr, w3) if pool2_addr else 0
-                                
-                                # Get amounts
-                                amount_out1 = await self._get_amount_out(
-                                    token_addresses.get(token_in.upper(), ""),
-                                    token_addresses.get(token_out.upper(), ""),
-                                    amount, ex1, w3
-                                )
-                                amount_out2 = await self._get_amount_out(
-                                    token_addresses.get(token_in.upper(), ""),
-                                    token_addresses.get(token_out.upper(), ""),
-                                    amount, ex2, w3
-                                )
-                                
-                                # Calculate profit
-                                profit = await self._calculate_arbitrage_profit(
-                                    token_in, token_out, amount, ex1, ex2
-                                )
-                                
-                                if profit >= self.min_profit:
-                                    # Build complete swap data
-                                    fee_tier1 = 3000 if "v3" in ex1 else 300
-                                    fee_tier2 = 3000 if "v3" in ex2 else 300
-                                    
-                                    signal = TradeSignal(
-                                        strategy=TradingStrategy.ARBITRAGE,
-                                        path=[token_in, token_out],
-                                        exchanges=[ex1, ex2],
-                                        amount_in=amount,
-                                        amount_out=max(amount_out1, amount_out2),
-                                        min_out=min(amount_out1, amount_out2) * 0.99,
-                                        pool_addresses=[pool1_addr or "", pool2_addr or ""],
-                                        pool_liquidities=[liquidity1, liquidity2],
-                                        fee_tiers=[fee_tier1, fee_tier2],
-                                        token_addresses=[
-                                            token_addresses.get(token_in.upper(), ""),
-                                            token_addresses.get(token_out.upper(), "")
-                                        ],
-                                        # Legacy fields
-                                        token_in=token_in,
-                                        token_out=token_out,
-                                        amount=amount,
-                                        expected_profit=profit,
-                                        confidence=self._calculate_confidence(diff),
-                                        entry_price=price1,
-                                        target_price=price2,
-                                        stop_loss=price1 * (1 - self.max_slippage),
-                                        timestamp=time.time(),
-                                        timeframe="1m",
-                                        expires_at=time.time() + 30,
-                                        indicators={
-                                            "price_diff": diff,
-                                            "exchange_1": ex1,
-                                            "exchange_2": ex2,
-                                            "price_impact": amount / max(liquidity1, liquidity2) if max(liquidity1, liquidity2) > 0 else 0
-                                        }
-                                    )
-                                    opportunities.append(signal)
-        
-        # Sort by profit
-        opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
-        return opportunities[:self.config.get("max_concurrent_trades", 15)]
+
+        # Cap in-flight RPCs so the fan-out doesn't overwhelm the endpoint
+        sem = asyncio.Semaphore(32)
+
+        async def bounded(coro):
+            async with sem:
+                return await coro
+
+        # Phase 1: fetch one direction per unordered pair - the reverse
+        # rate comes from the same reserves, so it's derived locally,
+        # halving the price RPC load
+        price_keys = [
+            (token_in, token_out, ex)
+            for token_in, token_out in itertools.combinations(tokens, 2)
+            for ex in exchanges
+        ]
+        self._rpc_failures.clear()
+        price_vals = await asyncio.gather(
+            *[bounded(self._get_price(ti, to, ex)) for ti, to, ex in price_keys]
+        )
+
+        # Bail out when the endpoint is clearly unhealthy - running the
+        # rest of the scan would just burn CPU on fallback lookups. The
+        # engine's scan gather logs this per scanner.
+        failures = sum(self._rpc_failures.values())
+        if failures and failures >= max(8, len(price_keys) // 2):
+            raise RPCDegradedError(
+                f"RPC degraded, aborting scan: {dict(self._rpc_failures)}"
+            )
+
+        # Screen every (token, token, ex1, ex2) quadruple in one NumPy
+        # broadcast instead of millions of interpreter branches; missing
+        # prices stay NaN and never compare true against the threshold
+        n_tokens = len(tokens)
+        n_ex = len(exchanges)
+        token_idx = self._token_idx
+        ex_idx = self._ex_idx
+
+        P = np.full((n_tokens, n_tokens, n_ex), np.nan, dtype=np.float64)
+        for (token_in, token_out, ex), price in zip(price_keys, price_vals):
+            if price:
+                i, j, e = token_idx[token_in], token_idx[token_out], ex_idx[ex]
+                P[i, j, e] = price
+                P[j, i, e] = 1.0 / price  # Reciprocal direction, no RPC
+
+        candidates = []
+        for i, j, e1, e2 in screen_price_matrix(P, self.MIN_PRICE_DIFF):
+            # The diff is symmetric in both the token and exchange axes -
+            # keep only the upper triangles; each mirrored index is the
+            # same opportunity and would double-execute downstream
+            if j <= i or e2 <= e1:
+                continue
+            price1 = float(P[i, j, e1])
+            price2 = float(P[i, j, e2])
+            diff = abs(price1 - price2) / min(price1, price2)
+            candidates.append((
+                tokens[i], tokens[j], exchanges[e1], exchanges[e2],
+                price1, price2, diff,
+            ))
+
+        if not candidates:
+            return opportunities
+
+        # Phase 2: shard the survivors per (ex1, ex2) pair - each shard
+        # has its own 2s budget, so one throttled endpoint cannot starve
+        # the rest of the scan (bulkhead isolation)
+        groups: Dict[Tuple[str, str], list] = {}
+        for cand in candidates:
+            groups.setdefault((cand[2], cand[3]), []).append(cand)
+
+        async def shard(group):
+            try:
+                return await asyncio.wait_for(
+                    self._scan_exchange_pair(group, token_addresses, amount, w3, bounded),
+                    timeout=2.0,
+                )
+            except asyncio.TimeoutError:
+                ex1, ex2 = group[0][2], group[0][3]
+                logger.debug(f"Exchange pair {ex1}/{ex2} timed out, skipped")
+                return []
+
+        async with asyncio.TaskGroup() as tg:
+            shard_tasks = [tg.create_task(shard(group)) for group in groups.values()]
+
+        for task in shard_tasks:
+            opportunities.extend(task.result())
+
+        # Top-K by profit - O(N log K) instead of a full sort
+        return nlargest(
+            self.max_concurrent_trades,
+            opportunities,
+            key=_PROFIT_KEY,
+        )
     
+    async def _scan_exchange_pair(
+        self, candidates: list, token_addresses: Dict[str, str],
+        amount: float, w3, bounded
+    ) -> List[TradeSignal]:
+        """Resolve pools/liquidity/amounts and build signals for one
+        (ex1, ex2) shard of screened candidates"""
+        signals = []
+
+        pool_keys = list({
+            (token_in, token_out, ex)
+            for token_in, token_out, ex1, ex2, _, _, _ in candidates
+            for ex in (ex1, ex2)
+        })
+        pool_vals = await asyncio.gather(*[
+            bounded(self._get_pool_address(
+                token_addresses.get(ti.upper(), ""),
+                token_addresses.get(to.upper(), ""),
+                ex, w3
+            ))
+            for ti, to, ex in pool_keys
+        ])
+        pools = dict(zip(pool_keys, pool_vals))
+
+        # All pool reserves in one Multicall3 round-trip
+        unique_pools = list({addr for addr in pool_vals if addr})
+        try:
+            reserves_list = await self._multicall_reserves(unique_pools)
+        except Exception as e:
+            logger.debug(f"Multicall reserves failed, falling back: {e}")
+            reserves_list = [None] * len(unique_pools)
+        liquidity_by_pool = {}
+        for addr, reserves in zip(unique_pools, reserves_list):
+            if reserves is None:
+                liquidity_by_pool[addr] = await self._get_pool_liquidity(addr, w3)
+            else:
+                # Simplified - use ~$2000/ETH (matches _get_pool_liquidity)
+                liquidity_by_pool[addr] = (reserves[0] + reserves[1]) / 1e18 * 2000
+
+        amount_vals = await asyncio.gather(*[
+            bounded(self._get_amount_out(
+                token_addresses.get(ti.upper(), ""),
+                token_addresses.get(to.upper(), ""),
+                amount, ex, w3,
+                pools.get((ti, to, ex))
+            ))
+            for ti, to, ex in pool_keys
+        ])
+        amounts_out = dict(zip(pool_keys, amount_vals))
+
+        now = time.time()  # One clock read for the whole shard
+        for token_in, token_out, ex1, ex2, price1, price2, diff in candidates:
+            pool1_addr = pools.get((token_in, token_out, ex1))
+            pool2_addr = pools.get((token_in, token_out, ex2))
+
+            liquidity1 = liquidity_by_pool.get(pool1_addr, 0) if pool1_addr else 0
+            liquidity2 = liquidity_by_pool.get(pool2_addr, 0) if pool2_addr else 0
+
+            amount_out1 = amounts_out.get((token_in, token_out, ex1), 0.0)
+            amount_out2 = amounts_out.get((token_in, token_out, ex2), 0.0)
+
+            # Calculate profit from the phase-1 prices - no refetch
+            profit = self._calculate_arbitrage_profit(amount, price1, price2)
+
+            if profit >= self.min_profit:
+                # Build complete swap data
+                fee_tier1 = exchange_fee_tier(ex1)
+                fee_tier2 = exchange_fee_tier(ex2)
+
+                signal = TradeSignal(
+                    strategy=TradingStrategy.ARBITRAGE,
+                    path=[token_in, token_out],
+                    exchanges=[ex1, ex2],
+                    amount_in=amount,
+                    amount_out=max(amount_out1, amount_out2),
+                    min_out=min(amount_out1, amount_out2) * 0.99,
+                    pool_addresses=[pool1_addr or "", pool2_addr or ""],
+                    pool_liquidities=[liquidity1, liquidity2],
+                    fee_tiers=[fee_tier1, fee_tier2],
+                    token_addresses=[
+                        token_addresses.get(token_in.upper(), ""),
+                        token_addresses.get(token_out.upper(), "")
+                    ],
+                    # Legacy fields
+                    token_in=token_in,
+                    token_out=token_out,
+                    amount=amount,
+                    expected_profit=profit,
+                    confidence=self._calculate_confidence(diff),
+                    entry_price=price1,
+                    target_price=price2,
+                    stop_loss=price1 * (1 - self.max_slippage),
+                    timestamp=now,
+                    timeframe="1m",
+                    expires_at=now + 30,
+                    indicators=ArbIndicators(
+                        price_diff=diff,
+                        exchange_1=ex1,
+                        exchange_2=ex2,
+                        price_impact=amount / max(liquidity1, liquidity2) if max(liquidity1, liquidity2) > 0 else 0,
+                    )
+                )
+                signals.append(signal)
+
+        return signals
+
+    def _pair_contract(self, address: str):
+        """V2 pair contract for an address, built once and reused"""
+        contract = self._pair_contracts.get(address)
+        if contract is None:
+            contract = self._w3.eth.contract(address=address, abi=UNIV2_PAIR_ABI)
+            self._pair_contracts[address] = contract
+        return contract
+
+    def _v3_pool_contract(self, address: str):
+        """V3 pool contract for an address, built once and reused"""
+        contract = self._v3_pool_contracts.get(address)
+        if contract is None:
+            contract = self._w3.eth.contract(address=address, abi=UNIV3_POOL_ABI)
+            self._v3_pool_contracts[address] = contract
+        return contract
+
+    def _note_rpc_failure(self, exc: BaseException):
+        """Count an RPC failure for the degradation circuit breaker"""
+        self._rpc_failures[type(exc).__name__] += 1
+
+    async def _multicall(self, calls: List[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+        """Batch eth_calls through Multicall3 aggregate3 - one round-trip
+
+        calls is a list of (target_address, calldata); failed sub-calls
+        come back as None instead of sinking the whole batch.
+        """
+        if not calls:
+            return []
+        data = _AGGREGATE3_SELECTOR + abi_encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, True, calldata) for target, calldata in calls]]
+        )
+        raw = await self._w3.eth.call({"to": MULTICALL3_ADDRESS, "data": data})
+        (results,) = abi_decode(["(bool,bytes)[]"], raw)
+        return [ret if ok else None for ok, ret in results]
+
+    async def _multicall_reserves(self, pool_addrs: List[str]) -> List[Optional[Tuple[int, int]]]:
+        """Fetch getReserves for many pools in a single aggregate3 call"""
+        results = await self._multicall(
+            [(addr, _GETRESERVES_CALLDATA) for addr in pool_addrs]
+        )
+        reserves = []
+        for ret in results:
+            if not ret:
+                reserves.append(None)
+                continue
+            try:
+                r0, r1, _ = abi_decode(["uint112", "uint112", "uint32"], ret)
+                reserves.append((r0, r1))
+            except Exception:
+                reserves.append(None)
+        return reserves
+
+    @async_ttl_cache(ttl=86400.0, symmetric_pair=True)
+    async def _get_v3_pool(self, token_a: str, token_b: str) -> Optional[str]:
+        """Resolve a V3 pool across all fee tiers in one multicall
+
+        Pool addresses never change, so hits are cached for a day.
+        """
+        calls = [
+            (
+                UNIV3_FACTORY_ADDRESS,
+                _GETPOOL_SELECTOR + abi_encode(
+                    ["address", "address", "uint24"], [token_a, token_b, fee]
+                ),
+            )
+            for fee in V3_FEE_TIERS
+        ]
+        try:
+            results = await self._multicall(calls)
+        except Exception as e:
+            logger.debug(f"V3 pool multicall failed: {e}")
+            return None
+
+        for ret in results:
+            if not ret:
+                continue
+            try:
+                (pool,) = abi_decode(["address"], ret)
+            except Exception:
+                continue
+            if int(pool, 16) != 0:
+                return to_checksum_address(pool)
+        return None
+
+    @async_ttl_cache(ttl=3600.0, symmetric_pair=True)
     async def _get_pool_address(self, token_a: str, token_b: str, exchange: str, w3) -> Optional[str]:
-        """Get pool address for token pair on exchange"""
+        """Get pool address for token pair on exchange (cached 1h)"""
         try:
             if not token_a or not token_b:
                 return None
                 
-            if "uniswap_v3" in exchange or "v3" in exchange:
-                factory = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
-                for fee in [3000, 500, 10000]:
-                    factory_abi = '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},{"name":"tokenB","type":"address"},{"name":"fee","type":"uint24"}],"name":"getPool","outputs":[{"name":"pool","type":"address"}],"type":"function"}]'
-                    factory_contract = w3.eth.contract(address=factory, abi=factory_abi)
-                    pool = factory_contract.functions.getPool(token_a, token_b, fee).call()
-                    if pool != "0x0000000000000000000000000000000000000000":
-                        return pool
+            kind = exchange_kind(exchange)
+            if kind == "v3":
+                return await self._get_v3_pool(token_a, token_b)
             
-            elif "uniswap_v2" in exchange or "sushi" in exchange:
-                factory = "0x5C69bEe701ef814a2B6fe3cF77eE1eD5e2b3f2c4"
-                if token_a.lower() > token_b.lower():
-                    token_a, token_b = token_b, token_a
-                factory_abi = '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},{"name":"tokenB","type":"address"}],"name":"getPair","outputs":[{"name":"pair","type":"address"}],"type":"function"}]'
-                factory_contract = w3.eth.contract(address=factory, abi=factory_abi)
-                pair = factory_contract.functions.getPair(token_a, token_b).call()
-                if pair != "0x0000000000000000000000000000000000000000":
-                    return pair
+            elif kind == "v2":
+                # Factory and init hash must come from the same DEX or the
+                # derived address exists nowhere
+                if "sushi" in exchange:
+                    factory, init_hash = SUSHISWAP_FACTORY_ADDRESS, SUSHISWAP_INIT_CODE_HASH
+                else:
+                    factory, init_hash = UNIV2_FACTORY_ADDRESS, UNIV2_INIT_CODE_HASH
+                return compute_v2_pair_address(token_a, token_b, factory, init_hash)
             
             return None
-        except:
+        except RPC_ERRORS as e:
+            self._note_rpc_failure(e)
             return None
-    
+
+    @async_ttl_cache(ttl=10.0)
     async def _get_pool_liquidity(self, pool_address: str, w3) -> float:
-        """Get pool liquidity in USD"""
+        """Get pool liquidity in USD (cached 10s)"""
         try:
             if not pool_address:
                 return 0.0
             
-            pair_abi = '[{"constant":true,"inputs":[],"name":"getReserves","outputs":[{"name":"reserve0","type":"uint112"},{"name":"reserve1","type":"uint112"},{"name":"blockTimestampLast","type":"uint32"}],"type":"function"}]'
-            contract = w3.eth.contract(address=pool_address, abi=pair_abi)
-            reserves = contract.functions.getReserves().call()
-            
+            contract = self._pair_contract(pool_address)
+            reserves = await contract.functions.getReserves().call()
+
             # Simplified - use ~$2000/ETH
             liquidity_eth = (reserves[0] + reserves[1]) / 1e18
             return liquidity_eth * 2000
-            
-        except:
+
+        except RPC_ERRORS as e:
+            self._note_rpc_failure(e)
             return 0.0
     
-    async def _get_amount_out(self, token_in: str, token_out: str, amount: float, exchange: str, w3) -> float:
-        """Get expected output amount from swap"""
+    async def _get_amount_out(
+        self, token_in: str, token_out: str, amount: float, exchange: str, w3,
+        pool: Optional[str] = None
+    ) -> float:
+        """Get expected output amount from swap
+
+        Callers that already resolved the pool pass it in, skipping a
+        redundant (if cached) pool lookup per quote.
+        """
         try:
-            pool = await self._get_pool_address(token_in, token_out, exchange, w3)
+            if pool is None:
+                pool = await self._get_pool_address(token_in, token_out, exchange, w3)
             if not pool:
                 return 0.0
             
-            reserves_abi = '[{"constant":true,"inputs":[],"name":"getReserves","outputs":[{"name":"reserve0","type":"uint112"},{"name":"reserve1","type":"uint112"}],"type":"function"}]'
-            contract = w3.eth.contract(address=pool, abi=reserves_abi)
-            reserves = contract.functions.getReserves().call()
-            
-            fee = 0.003 if "v3" in exchange else 0.003
-            
+            contract = self._pair_contract(pool)
+            reserves = await contract.functions.getReserves().call()
+
             if token_in.lower() < token_out.lower():
                 reserve_in, reserve_out = reserves[0], reserves[1]
             else:
                 reserve_in, reserve_out = reserves[1], reserves[0]
-            
-            amount_in_fee = amount * (1 - fee)
-            return (amount_in_fee * reserve_out) / (reserve_in + amount_in_fee)
-            
-        except:
+
+            # Canonical Uniswap V2 integer formula (0.3% fee): exact on
+            # uint112 reserves, no float cancellation at ~1e22 magnitudes
+            amount_in_with_fee = int(amount) * 997
+            numerator = amount_in_with_fee * reserve_out
+            denominator = reserve_in * 1000 + amount_in_with_fee
+            if denominator == 0:
+                return 0.0
+            return numerator // denominator
+
+        except RPC_ERRORS as e:
+            self._note_rpc_failure(e)
             return 0.0
     
+    @async_ttl_cache(ttl=2.0)
     async def _get_price(self, token_in: str, token_out: str, exchange: str) -> Optional[float]:
-        """Get REAL price from exchange using on-chain data"""
+        """Get REAL price from exchange using on-chain data (cached 2s)"""
         try:
             # Try to get real price from on-chain DEX
             price = await self._get_onchain_price(token_in, token_out, exchange)
@@ -358,15 +881,8 @@ class AggressiveArbitrageScanner:
     async def _get_onchain_price(self, token_in: str, token_out: str, exchange: str) -> Optional[float]:
         """Get real price from DEX using on-chain data"""
         try:
-            from web3 import Web3
-            import os
-            
-            rpc_url = os.getenv("ETHEREUM_RPC_URL", "http://localhost:8545")
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-            
-            if not w3.is_connected():
-                return None
-            
+            w3 = self._w3
+
             # Get token addresses
             token_addresses = self._get_token_addresses()
             
@@ -376,17 +892,24 @@ class AggressiveArbitrageScanner:
             if not token_in_addr or not token_out_addr:
                 return None
             
+            kind = exchange_kind(exchange)
+
             # For Uniswap V2: query pair contract
-            if "uniswap_v2" in exchange or "sushiswap" in exchange:
-                # Calculate pair address
-                factory = "0x5C69bEe701ef814a2B6fe3cF77eE1eD5e2b3f2c4"
-                pair_address = self._get_uniswap_v2_pair(token_in_addr, token_out_addr, factory, w3)
-                
+            if kind == "v2":
+                # Calculate pair address from the matching DEX's factory
+                factory = (
+                    SUSHISWAP_FACTORY_ADDRESS
+                    if "sushi" in exchange
+                    else UNIV2_FACTORY_ADDRESS
+                )
+                pair_address = self._get_uniswap_v2_pair(
+                    token_in_addr, token_out_addr, factory, w3
+                )
+
                 if pair_address:
                     # Get reserves
-                    pair_abi = '[{"constant":true,"inputs":[],"name":"getReserves","outputs":[{"name":"reserve0","type":"uint112"},{"name":"reserve1","type":"uint112"},{"name":"blockTimestampLast","type":"uint32"}],"type":"function"}]'
-                    pair_contract = w3.eth.contract(address=pair_address, abi=pair_abi)
-                    reserves = pair_contract.functions.getReserves().call()
+                    pair_contract = self._pair_contract(pair_address)
+                    reserves = await pair_contract.functions.getReserves().call()
                     
                     # Calculate price
                     if token_in_addr.lower() < token_out_addr.lower():
@@ -397,13 +920,12 @@ class AggressiveArbitrageScanner:
                     return price
             
             # For Uniswap V3: use slot0
-            if "uniswap_v3" in exchange:
+            if kind == "v3":
                 # Query pool contract - simplified
-                pool_address = self._get_uniswap_v3_pool(token_in_addr, token_out_addr, w3)
+                pool_address = await self._get_uniswap_v3_pool(token_in_addr, token_out_addr, w3)
                 if pool_address:
-                    pool_abi = '[{"constant":true,"inputs":[],"name":"slot0","outputs":[{"name":"sqrtPriceX96","type":"uint160"},{"name":"tick","type":"int24"},{"name":"observationIndex","type":"uint16"},{"name":"observationCardinality","type":"uint16"},{"name":"observationCardinalityNext","type":"uint16"},{"name":"feeProtocol","type":"uint8"},{"name":"unlocked","type":"bool"}],"type":"function"}]'
-                    pool_contract = w3.eth.contract(address=pool_address, abi=pool_abi)
-                    slot0 = pool_contract.functions.slot0().call()
+                    pool_contract = self._v3_pool_contract(pool_address)
+                    slot0 = await pool_contract.functions.slot0().call()
                     
                     sqrt_price_x96 = slot0[0]
                     price = (sqrt_price_x96 ** 2) / (2 ** 192)
@@ -416,105 +938,94 @@ class AggressiveArbitrageScanner:
             
             return None
             
-        except Exception as e:
+        except RPC_ERRORS as e:
+            self._note_rpc_failure(e)
             logger.debug(f"On-chain price failed: {e}")
             return None
     
     def _get_token_addresses(self) -> Dict[str, str]:
         """Get token addresses for mainnet"""
-        return {
-            "ETH": "0x0000000000000000000000000000000000000000",
-            "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
-            "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-            "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
-            "DAI": "0x6B175474E89094C44Da98b954EesADeF9D188B8",  # Fixed typo
-            "WBTC": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
-            "LINK": "0x514910771AF9Ca656af840dff83E8264EcF986CA",
-            "UNI": "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984",
-            "AAVE": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
-            "CRV": "0xD533a949740bb3306d119CC777fa900bA034cd52",
-            "SUSHI": "0x6B3595068778DD592e39A122f4f5a5cF09C90fE2",
-            "SNX": "0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F",
-            "COMP": "0xc00e94Cb662C3520282E6f5717214004A7f26888",
-            "MKR": "0x9f8F72aA9304c8B593d555F12eF6589cC3B57965",
-            "MATIC": "0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeeb0",
-            "LDO": "0x5A98FcBEA4Cf5422B8948a6e3f2eF3A92dF8B80",
-            "OP": "0x4200000000000000000000000000000000000006",
-            "ARB": "0x912CE59144191C1204E61159e7a6E8fA17F5A95A",
-            "STETH": "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84",
-            "RETH": "0xae78736Cd615f374D3085123A210169E74C93BE9",
-            "GMX": "0xfc5A1A6EB076a2C7ad06e22dc90D6F1F6bb62e53",
-            "RNDR": "0x5282F1B197fF2e3B72D84b9061D9c8D53E0a4F1F",
-        }
-    
+        return TOKEN_ADDRESSES
+
     def _get_uniswap_v2_pair(self, token_a: str, token_b: str, factory: str, w3) -> Optional[str]:
-        """Calculate Uniswap V2 pair address"""
+        """Calculate Uniswap V2 pair address locally via CREATE2"""
         try:
-            # Sort tokens
-            if token_a.lower() > token_b.lower():
-                token_a, token_b = token_b, token_a
-            
-            # Factory ABI
-            factory_abi = '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},{"name":"tokenB","type":"address"}],"name":"getPair","outputs":[{"name":"pair","type":"address"}],"type":"function"}]'
-            factory_contract = w3.eth.contract(address=factory, abi=factory_abi)
-            pair_address = factory_contract.functions.getPair(token_a, token_b).call()
-            
-            if pair_address and pair_address != "0x0000000000000000000000000000000000000000":
-                return pair_address
-            
-            return None
-        except:
+            if not token_a or not token_b:
+                return None
+            init_hash = (
+                SUSHISWAP_INIT_CODE_HASH
+                if factory == SUSHISWAP_FACTORY_ADDRESS
+                else UNIV2_INIT_CODE_HASH
+            )
+            return compute_v2_pair_address(token_a, token_b, factory, init_hash)
+        except ValueError:
             return None
-    
-    def _get_uniswap_v3_pool(self, token_a: str, token_b: str, w3) -> Optional[str]:
-        """Get Uniswap V3 pool address"""
+
+    async def _get_uniswap_v3_pool(self, token_a: str, token_b: str, w3) -> Optional[str]:
+        """Get Uniswap V3 pool address (all fee tiers, one multicall)"""
+        return await self._get_v3_pool(token_a, token_b)
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive HTTP session, created lazily"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def prefetch_coingecko_prices(self, token_symbols: List[str]):
+        """Prime the CoinGecko price cache for many tokens in one request
+
+        The free tier rate-limits hard, so a scan should batch its token
+        list through here instead of one request per symbol.
+        """
         try:
-            # Uniswap V3 factory
-            factory = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
-            
-            # Common fee tiers
-            fee_tiers = [3000, 500, 10000]
-            
-            factory_abi = '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},{"name":"tokenB","type":"address"},{"name":"fee","type":"uint24"}],"name":"getPool","outputs":[{"name":"pool","type":"address"}],"type":"function"}]'
-            factory_contract = w3.eth.contract(address=factory, abi=factory_abi)
-            
-            for fee in fee_tiers:
-                pool = factory_contract.functions.getPool(token_a, token_b, fee).call()
-                if pool != "0x0000000000000000000000000000000000000000":
-                    return pool
-            
-            return None
-        except:
-            return None
-    
+            ids = {
+                COINGECKO_IDS[sym.upper()]: sym.upper()
+                for sym in token_symbols
+                if sym.upper() in COINGECKO_IDS
+            }
+            if not ids:
+                return
+            url = (
+                "https://api.coingecko.com/api/v3/simple/price?ids="
+                + ",".join(ids) + "&vs_currencies=usd"
+            )
+            session = await self._ensure_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                if resp.status != 200:
+                    return
+                data = await resp.json()
+
+            # Write through the TTL cache used by _get_coingecko_price
+            cache = getattr(self, "_ttl__get_coingecko_price", None)
+            if cache is None:
+                cache = {}
+                setattr(self, "_ttl__get_coingecko_price", cache)
+            expiry = time.monotonic() + 60.0
+            for token_id, sym in ids.items():
+                price = data.get(token_id, {}).get("usd")
+                if price:
+                    cache[(sym,)] = (float(price), expiry)
+        except Exception as e:
+            logger.debug(f"CoinGecko prefetch failed: {e}")
+
+    @async_ttl_cache(ttl=60.0)
     async def _get_coingecko_price(self, token_symbol: str) -> Optional[float]:
-        """Get price from CoinGecko API"""
+        """Get price from CoinGecko API (cached 60s)"""
         try:
-            import aiohttp
-            
-            # Token ID mapping
-            token_ids = {
-                "ETH": "ethereum", "WETH": "ethereum", "USDC": "usd-coin",
-                "USDT": "tether", "DAI": "dai", "WBTC": "wrapped-bitcoin",
-                "LINK": "chainlink", "UNI": "uniswap", "AAVE": "aave",
-                "CRV": "curve-dao-token", "SUSHI": "sushi", "SNX": "havven",
-                "COMP": "compound-governance-token", "MKR": "maker",
-                "MATIC": "matic-network", "LDO": "lido-dao", "OP": "optimism",
-                "ARB": "arbitrum", "GMX": "gmx", "RNDR": "render-token"
-            }
-            
-            token_id = token_ids.get(token_symbol.upper())
+            token_id = COINGECKO_IDS.get(token_symbol.upper())
             if not token_id:
                 return None
             
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={token_id}&vs_currencies=usd"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return float(data[token_id]["usd"])
-            
+            session = await self._ensure_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    return float(data[token_id]["usd"])
+
             return None
         except Exception as e:
             logger.debug(f"CoinGecko API failed: {e}")
@@ -522,33 +1033,21 @@ class AggressiveArbitrageScanner:
     
     def _get_cached_price(self, token_in: str, token_out: str) -> float:
         """Get cached/fallback price"""
-        # Use realistic prices as last resort
-        fallback_prices = {
-            ("ETH", "USDC"): 2000.0, ("WETH", "USDC"): 2000.0,
-            ("WBTC", "USDC"): 42000.0, ("LINK", "USDC"): 15.0,
-            ("UNI", "USDC"): 7.0, ("AAVE", "USDC"): 100.0,
-            ("USDC", "USDT"): 1.0, ("DAI", "USDC"): 1.0,
-        }
-        
-        return fallback_prices.get((token_in.upper(), token_out.upper()), 1.0)
+        return _FALLBACK_PRICES.get((token_in.upper(), token_out.upper()), 1.0)
     
-    async def _calculate_arbitrage_profit(
-        self, token_in: str, token_out: str, 
-        amount: float, ex1: str, ex2: str
+    def _calculate_arbitrage_profit(
+        self, amount: float, price1: float, price2: float
     ) -> float:
-        """Calculate potential arbitrage profit"""
-        price1 = await self._get_price(token_in, token_out, ex1)
-        price2 = await self._get_price(token_in, token_out, ex2)
-        
+        """Calculate potential arbitrage profit from already-fetched prices"""
         if not price1 or not price2:
             return 0
-        
+
         # Calculate gross profit
         price_diff = abs(price1 - price2) / min(price1, price2)
         gross_profit = amount * price_diff
         
         # Subtract estimated costs
-        gas_cost = await self._estimate_gas_cost(signal)  # Estimated gas in USD
+        gas_cost = 50.0  # Estimated gas in USD
         flash_loan_fee = amount * 0.0009  # Aave 0.09%
         slippage_cost = amount * self.max_slippage
         
@@ -557,15 +1056,12 @@ class AggressiveArbitrageScanner:
         return max(0, net_profit)
     
     def _calculate_confidence(self, price_diff: float) -> float:
-        """Calculate confidence based on price difference"""
-        if price_diff >= self.OPTIMAL_PRICE_DIFF:
-            return 0.95
-        elif price_diff >= 0.003:
-            return 0.85
-        elif price_diff >= 0.002:
-            return 0.75
-        else:
-            return 0.6
+        """Calculate confidence based on price difference
+
+        Binned to 4 decimals and memoized - the same handful of diff
+        buckets recur across every candidate in a scan.
+        """
+        return _confidence_for_diff(round(price_diff, 4))
 
 
 class TriangularArbitrageScanner:
@@ -573,138 +1069,160 @@ class TriangularArbitrageScanner:
     Triangular arbitrage within single exchange
     ETH -> USDC -> DAI -> ETH
     """
-    
+
     def __init__(self, config: Dict):
         self.config = config
         self.min_profit = config.get("min_profit_per_trade", 200)
-        
+        self.loan_amount = config.get("loan_amount", 75000)
+
+        # Shared async provider for reserve reads (no per-call Web3)
+        self._rpc_url = os.getenv("ETHEREUM_RPC_URL")
+        self._w3 = (
+            AsyncWeb3(AsyncHTTPProvider(self._rpc_url, request_kwargs={"timeout": 5}))
+            if self._rpc_url else None
+        )
+        self._pair_contracts: Dict[str, Any] = {}
+
+        # Adjacency pruning: a path is only worth quoting if every hop can
+        # trade. By default that means both tokens have a known address;
+        # config["adjacency"] can narrow it to pairs with actual pools.
+        tradeable = frozenset(TOKEN_ADDRESSES)
+        self._tradeable = tradeable
+        self._adjacency = {
+            token.upper(): frozenset(n.upper() for n in neighbors) & tradeable
+            for token, neighbors in (config.get("adjacency") or {}).items()
+        }
+
+    def _neighbors(self, token: str) -> frozenset:
+        """Tokens this token can trade against"""
+        return self._adjacency.get(token.upper(), self._tradeable)
+
     async def scan_triangular_opportunities(self) -> List[TradeSignal]:
-        """Scan for triangular arbitrage opportunities"""
+        """Scan for triangular arbitrage opportunities
+
+        Fetches every distinct directed rate once in a concurrent batch,
+        then evaluates all candidate paths as one vectorized product
+        instead of three sequential RPCs per path.
+        """
         opportunities = []
-        
+
         # Base tokens for triangulation
         bases = ["ETH", "USDC", "USDT", "DAI", "WBTC"]
         tokens = self.config.get("tokens", [])
-        
+        amount = self.loan_amount
+
+        paths = []
         for base1 in bases:
+            if base1.upper() not in self._tradeable:
+                continue
+            base1_neighbors = self._neighbors(base1)
             for mid in tokens:
+                if mid.upper() not in self._tradeable:
+                    continue
+                mid_neighbors = self._neighbors(mid)
                 for base2 in bases:
                     if base1 == mid or base1 == base2 or mid == base2:
                         continue
-                    
-                    # Try different paths
-                    paths = [
-                        (base1, mid, base2),  # base1 -> mid -> base2 -> base1
-                        (base1, base2, mid),  # base1 -> base2 -> mid -> base1
-                    ]
-                    
-                    for path in paths:
-                        profit = await self._calculate_triangular_profit(
-                            path[0], path[1], path[2],
-                            self.config.get("loan_amount", 75000)
-                        )
-                        
-                        if profit >= self.min_profit:
-                            signal = TradeSignal(
-                                strategy=TradingStrategy.TRIANGULAR,
-                                token_in=path[0],
-                                token_out=path[1],
-                                amount=self.config.get("loan_amount", 75000),
-                                expected_profit=profit,
-                                confidence=0.85,
-                                entry_price=1.0,
-                                target_price=1.0 + profit/10000,
-                                stop_loss=0.99,
-                                timestamp=time.time(),
-                                timeframe="30s",
-                                indicators={"path": path}
-                            )
-                            opportunities.append(signal)
-        
-        opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
-        return opportunities[:10]
-    
-    async def _calculate_triangular_profit(
-        self, token1: str, token2: str, token3: str, amount: float
-    ) -> float:
-        """Calculate triangular arbitrage profit"""
-        # Simulate triangular trade
-        # In production, query real pool reserves
-        
-        # Path: 1 -> 2 -> 3 -> 1
-        rate1_2 = await self._get_onchain_rate(token1, token2)
-        rate2_3 = await self._get_onchain_rate(token2, token3)
-        rate3_1 = await self._get_onchain_rate(token3, token1)
-        
-        # Calculate final amount
-        final_amount = amount * rate1_2 * rate2_3 * rate3_1
-        
-        # Profit
-        gross_profit = final_amount - amount
-        
-        # Costs
+                    if base2.upper() not in self._tradeable:
+                        continue
+                    base2_neighbors = self._neighbors(base2)
+                    # Try different paths whose every hop is tradeable
+                    if (mid.upper() in base1_neighbors
+                            and base2.upper() in mid_neighbors
+                            and base1.upper() in base2_neighbors):
+                        paths.append((base1, mid, base2))   # base1 -> mid -> base2 -> base1
+                    if (base2.upper() in base1_neighbors
+                            and mid.upper() in base2_neighbors
+                            and base1.upper() in mid_neighbors):
+                        paths.append((base1, base2, mid))   # base1 -> base2 -> mid -> base1
+
+        if not paths:
+            return opportunities
+
+        # Unique directed edges across all paths, fetched concurrently
+        edges = list({
+            (path[0], path[1])
+            for path in paths
+        } | {
+            (path[1], path[2])
+            for path in paths
+        } | {
+            (path[2], path[0])
+            for path in paths
+        })
+        rate_vals = await asyncio.gather(
+            *[self._get_onchain_rate(a, b) for a, b in edges]
+        )
+        rates = dict(zip(edges, rate_vals))
+
+        # Vectorized profit over all paths: amount * r1*r2*r3 - costs
+        r1 = np.fromiter((rates.get((p[0], p[1]), 0.0) for p in paths), dtype=np.float64, count=len(paths))
+        r2 = np.fromiter((rates.get((p[1], p[2]), 0.0) for p in paths), dtype=np.float64, count=len(paths))
+        r3 = np.fromiter((rates.get((p[2], p[0]), 0.0) for p in paths), dtype=np.float64, count=len(paths))
+
         gas_cost = 30
         flash_loan_fee = amount * 0.0009
-        
-        net_profit = gross_profit - gas_cost - flash_loan_fee
-        
-        return max(0, net_profit)
-    
+        profits = tri_profits(r1, r2, r3, amount, gas_cost, flash_loan_fee)
+
+        # Select the top 10 with argpartition before building any signal -
+        # only the emitted dataclasses are ever constructed
+        survivors = np.flatnonzero(profits >= self.min_profit)
+        if survivors.size > 10:
+            top = np.argpartition(-profits[survivors], 10)[:10]
+            survivors = survivors[top]
+        survivors = survivors[np.argsort(-profits[survivors])]
+
+        now = time.time()
+        strategy = TradingStrategy.TRIANGULAR  # Bound once outside the loop
+        for idx in survivors:
+            path = paths[idx]
+            profit = float(profits[idx])
+            signal = TradeSignal(
+                strategy=strategy,
+                token_in=path[0],
+                token_out=path[1],
+                amount=amount,
+                expected_profit=profit,
+                confidence=0.85,
+                entry_price=1.0,
+                target_price=1.0 + profit / 10000,
+                stop_loss=0.99,
+                timestamp=now,
+                timeframe="30s",
+                indicators={"path": path}
+            )
+            opportunities.append(signal)
+
+        return opportunities
+
     async def _get_onchain_rate(self, token_in: str, token_out: str) -> float:
         """Get real on-chain exchange rate from DEX pools"""
         try:
-            import os
-            from web3 import Web3
-            
-            rpc_url = os.getenv("ETHEREUM_RPC_URL")
-            if not rpc_url:
-                return 0.0
-            
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-            if not w3.is_connected():
+            if self._w3 is None:
                 return 0.0
-            
-            token_addresses = {
-                "ETH": "0x0000000000000000000000000000000000000000",
-                "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
-                "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-                "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
-                "DAI": "0x6B175474E89094C44Da98b954EedE6C8EDc609666",
-            }
-            
-            addr_in = token_addresses.get(token_in.upper())
-            addr_out = token_addresses.get(token_out.upper())
-            
+
+            addr_in = TOKEN_ADDRESSES.get(token_in.upper())
+            addr_out = TOKEN_ADDRESSES.get(token_out.upper())
+
             if not addr_in or not addr_out:
                 return 0.0
-            
-            factory = "0x5C69bEe701ef814a2B6fe3cF77eE1eD5e2b3f2c4"
-            pair_addr = self._get_pair_address(addr_in, addr_out, factory, w3)
-            
-            if pair_addr == "0x0000000000000000000000000000000000000000":
-                return 0.0
-            
-            pair_abi = '[{"constant":true,"inputs":[],"name":"getReserves","outputs":[{"name":"reserve0","type":"uint112"},{"name":"reserve1","type":"uint112"}],"type":"function"}]'
-            contract = w3.eth.contract(address=pair_addr, abi=pair_abi)
-            reserves = contract.functions.getReserves().call()
-            
+
+            # Pair address derived locally - only the reserves cost an RPC
+            pair_addr = compute_v2_pair_address(
+                addr_in, addr_out, UNIV2_FACTORY_ADDRESS, UNIV2_INIT_CODE_HASH
+            )
+            contract = self._pair_contracts.get(pair_addr)
+            if contract is None:
+                contract = self._w3.eth.contract(address=pair_addr, abi=UNIV2_PAIR_ABI)
+                self._pair_contracts[pair_addr] = contract
+            reserves = await contract.functions.getReserves().call()
+
             if addr_in.lower() < addr_out.lower():
                 return reserves[1] / reserves[0] if reserves[0] > 0 else 0
             else:
                 return reserves[0] / reserves[1] if reserves[1] > 0 else 0
         except Exception:
             return 0.0
-    
-    def _get_pair_address(self, token_a: str, token_b: str, factory: str, w3) -> str:
-        """Get pair address from factory"""
-        try:
-            if token_a.lower() > token_b.lower():
-                token_a, token_b = token_b, token_a
-            factory_abi = '[{"constant":true,"inputs":[{"name":"tokenA","type":"address"},{"name":"tokenB","type":"address"}],"name":"getPair","outputs":[{"name":"","type":"address"}],"type":"function"}]'
-            factory_contract = w3.eth.contract(address=factory, abi=factory_abi)
-            return factory_contract.functions.getPair(token_a, token_b).call()
-        except:
-            return "0x0000000000000000000000000000000000000000"
 
 
 class MomentumTrader:
@@ -713,46 +1231,127 @@ class MomentumTrader:
     Trades in direction of strong trends
     """
     
+    # Candles required before MACD momentum is trusted over the API
+    MACD_WARMUP = 35
+
     def __init__(self, config: Dict):
         self.config = config
         self.min_profit = config.get("min_profit_per_trade", 200)
-        
+        self.loan_amount = config.get("loan_amount", 75000)
+
+        # SoA ring buffer fed by record_price; once warm, momentum comes
+        # from the local MACD kernel instead of the remote API
+        self.price_history = PriceHistory(config.get("tokens", []), window=500)
+
+        # Incremental EMA state per token - O(1) per tick, preferred over
+        # recomputing from the history list once enough ticks have landed
+        self._ema_fast: Dict[str, StreamingEMA] = {}
+        self._ema_slow: Dict[str, StreamingEMA] = {}
+
+    def record_price(self, token: str, price: float):
+        """Append a price observation for local indicator computation"""
+        self.price_history.append(token, price)
+
+        fast = self._ema_fast.get(token)
+        if fast is None:
+            fast = self._ema_fast[token] = StreamingEMA(12)
+            self._ema_slow[token] = StreamingEMA(26)
+        fast.update(price)
+        self._ema_slow[token].update(price)
+
     async def scan_momentum_opportunities(self) -> List[TradeSignal]:
-        """Scan for momentum trading opportunities"""
+        """Scan for momentum trading opportunities
+
+        Momentum for every token is fetched in one concurrent batch and
+        thresholded as a vector; TradeSignal objects are only built for
+        the survivors.
+        """
         opportunities = []
-        
+
         tokens = self.config.get("tokens", [])
-        
+        if not tokens:
+            return opportunities
+
+        amount = self.loan_amount
+        momentums = await self._calculate_momentum_batch(tokens)
+        profits = np.abs(momentums) * amount * 5  # 5x leverage
+
+        keep = np.flatnonzero((np.abs(momentums) > 0.02) & (profits >= self.min_profit))
+        if keep.size > 10:
+            top = np.argpartition(-profits[keep], 10)[:10]
+            keep = keep[top]
+        keep = keep[np.argsort(-profits[keep])]
+        for idx in keep:
+            opportunities.append(self._build_signal(
+                tokens[idx], float(momentums[idx]), amount, float(profits[idx])
+            ))
+
+        return opportunities
+
+    def _build_signal(
+        self, token: str, momentum: float, amount: float, profit_estimate: float,
+        now: Optional[float] = None
+    ) -> TradeSignal:
+        """Build a momentum signal for a surviving token"""
+        if now is None:
+            now = time.time()
+        # Strong momentum detected
+        direction = "long" if momentum > 0 else "short"
+        return TradeSignal(
+            strategy=TradingStrategy.MOMENTUM,
+            token_in="USDC" if momentum > 0 else token,
+            token_out=token if momentum > 0 else "USDC",
+            amount=amount,
+            expected_profit=profit_estimate,
+            confidence=min(0.95, 0.6 + abs(momentum) * 10),
+            entry_price=1.0,
+            target_price=1.0 + abs(momentum) * 2,
+            stop_loss=1.0 - abs(momentum) * 0.5,
+            timestamp=now,
+            timeframe="5m",
+            indicators={"momentum": momentum, "direction": direction}
+        )
+
+    async def _calculate_momentum_batch(self, tokens: List[str]) -> np.ndarray:
+        """Momentum for all tokens, fetched concurrently into one array
+
+        Tokens with enough recorded history get MACD-histogram momentum
+        from the compiled batch kernel - no network at all; the rest fall
+        back to the per-token API fetch.
+        """
+        momentums = {}
+
+        # O(1) path: incremental EMAs warmed by record_price
         for token in tokens:
-            # Analyze momentum
-            momentum = await self._calculate_momentum(token)
-            
-            if abs(momentum) > 0.02:  # 2% threshold
-                # Strong momentum detected
-                direction = "long" if momentum > 0 else "short"
-                
-                profit_estimate = abs(momentum) * self.config.get("loan_amount", 75000) * 5  # 5x leverage
-                
-                if profit_estimate >= self.min_profit:
-                    signal = TradeSignal(
-                        strategy=TradingStrategy.MOMENTUM,
-                        token_in="USDC" if momentum > 0 else token,
-                        token_out=token if momentum > 0 else "USDC",
-                        amount=self.config.get("loan_amount", 75000),
-                        expected_profit=profit_estimate,
-                        confidence=min(0.95, 0.6 + abs(momentum) * 10),
-                        entry_price=1.0,
-                        target_price=1.0 + abs(momentum) * 2,
-                        stop_loss=1.0 - abs(momentum) * 0.5,
-                        timestamp=time.time(),
-                        timeframe="5m",
-                        indicators={"momentum": momentum, "direction": direction}
-                    )
-                    opportunities.append(signal)
-        
-        opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
-        return opportunities[:10]
-    
+            slow = self._ema_slow.get(token)
+            if slow is not None and slow.count >= self.MACD_WARMUP and slow.value:
+                fast = self._ema_fast[token]
+                momentums[token] = (fast.value - slow.value) / slow.value
+
+        # Bulk path: histories loaded without streaming state (backfills)
+        warm = [
+            t for t in tokens
+            if t not in momentums
+            and self.price_history.count(t) >= self.MACD_WARMUP
+        ]
+        if warm:
+            window = min(self.price_history.count(t) for t in warm)
+            matrix = self.price_history.matrix(warm, window)
+            _, _, histogram = macd_batch(matrix)
+            # Normalize the histogram by price for a dimensionless momentum
+            momentums.update(zip(warm, histogram[:, -1] / matrix[:, -1]))
+
+        cold = [t for t in tokens if t not in momentums]
+        if cold:
+            values = await asyncio.gather(
+                *[self._calculate_momentum(token) for token in cold]
+            )
+            momentums.update(zip(cold, values))
+
+        return np.fromiter(
+            (momentums[t] for t in tokens), dtype=np.float64, count=len(tokens)
+        )
+
     async def _calculate_momentum(self, token: str) -> float:
         """Calculate price momentum"""
         # In production, use real price data
@@ -761,19 +1360,11 @@ class MomentumTrader:
         # Simulate momentum
         return await self._get_real_momentum(token)
 
-
-class MeanReversionTrader:
-
     async def _get_real_momentum(self, token: str) -> float:
         """Get real price momentum from CoinGecko API"""
         try:
             import aiohttp
-            token_ids = {
-                "ETH": "ethereum", "WETH": "ethereum", "WBTC": "bitcoin",
-                "USDC": "usd-coin", "USDT": "tether", "DAI": "dai",
-                "LINK": "chainlink", "UNI": "uniswap", "AAVE": "aave"
-            }
-            token_id = token_ids.get(token.upper())
+            token_id = COINGECKO_IDS.get(token.upper())
             if not token_id:
                 return 0.0
             url = f"https://api.coingecko.com/api/v3/coins/{token_id}"
@@ -788,6 +1379,9 @@ class MeanReversionTrader:
         except Exception:
             return 0.0
 
+
+
+class MeanReversionTrader:
     """
     Mean reversion strategy
     Buys oversold, sells overbought
@@ -796,51 +1390,68 @@ class MeanReversionTrader:
     def __init__(self, config: Dict):
         self.config = config
         self.min_profit = config.get("min_profit_per_trade", 200)
-        
+        self.loan_amount = config.get("loan_amount", 75000)
+
     async def scan_mean_reversion_opportunities(self) -> List[TradeSignal]:
-        """Scan for mean reversion opportunities"""
+        """Scan for mean reversion opportunities
+
+        Deviations are fetched for all tokens in one concurrent batch and
+        masked as a vector before any signal is built.
+        """
         opportunities = []
-        
+
         tokens = self.config.get("tokens", [])
-        
-        for token in tokens:
-            deviation = await self._calculate_deviation(token)
-            
-            if abs(deviation) > 0.03:  # 3% deviation from mean
-                # Mean reversion opportunity
-                direction = "buy" if deviation < 0 else "sell"
-                
-                profit_estimate = abs(deviation) * self.config.get("loan_amount", 75000) * 3
-                
-                if profit_estimate >= self.min_profit:
-                    signal = TradeSignal(
-                        strategy=TradingStrategy.MEAN_REVERSION,
-                        token_in="USDC" if direction == "buy" else token,
-                        token_out=token if direction == "buy" else "USDC",
-                        amount=self.config.get("loan_amount", 75000),
-                        expected_profit=profit_estimate,
-                        confidence=min(0.9, 0.5 + abs(deviation) * 15),
-                        entry_price=1.0,
-                        target_price=1.0,
-                        stop_loss=1.0 - abs(deviation) * 0.3,
-                        timestamp=time.time(),
-                        timeframe="15m",
-                        indicators={"deviation": deviation, "direction": direction}
-                    )
-                    opportunities.append(signal)
-        
+        if not tokens:
+            return opportunities
+
+        amount = self.loan_amount
+        deviations = await self._calculate_deviation_batch(tokens)
+        profits = np.abs(deviations) * amount * 3
+
+        keep = (np.abs(deviations) > 0.03) & (profits >= self.min_profit)
+        for idx in np.flatnonzero(keep):
+            opportunities.append(self._build_signal(
+                tokens[idx], float(deviations[idx]), amount, float(profits[idx])
+            ))
+
         return opportunities[:10]
+
+    def _build_signal(
+        self, token: str, deviation: float, amount: float, profit_estimate: float,
+        now: Optional[float] = None
+    ) -> TradeSignal:
+        """Build a mean-reversion signal for a surviving token"""
+        if now is None:
+            now = time.time()
+        # Mean reversion opportunity
+        direction = "buy" if deviation < 0 else "sell"
+        return TradeSignal(
+            strategy=TradingStrategy.MEAN_REVERSION,
+            token_in="USDC" if direction == "buy" else token,
+            token_out=token if direction == "buy" else "USDC",
+            amount=amount,
+            expected_profit=profit_estimate,
+            confidence=min(0.9, 0.5 + abs(deviation) * 15),
+            entry_price=1.0,
+            target_price=1.0,
+            stop_loss=1.0 - abs(deviation) * 0.3,
+            timestamp=now,
+            timeframe="15m",
+            indicators={"deviation": deviation, "direction": direction}
+        )
+
+    async def _calculate_deviation_batch(self, tokens: List[str]) -> np.ndarray:
+        """Deviation from mean for all tokens, one concurrent batch"""
+        values = await asyncio.gather(
+            *[self._calculate_deviation(token) for token in tokens]
+        )
+        return np.fromiter(values, dtype=np.float64, count=len(tokens))
     
     async def _calculate_deviation(self, token: str) -> float:
         """Calculate real deviation from moving average using price data"""
         try:
             import aiohttp
-            token_ids = {
-                "ETH": "ethereum", "WETH": "ethereum", "WBTC": "bitcoin",
-                "USDC": "usd-coin", "USDT": "tether", "DAI": "dai",
-                "LINK": "chainlink", "UNI": "uniswap", "AAVE": "aave"
-            }
-            token_id = token_ids.get(token.upper())
+            token_id = COINGECKO_IDS.get(token.upper())
             if not token_id:
                 return 0.0
             # Get 7-day price history
@@ -870,49 +1481,67 @@ class VolatilityCapture:
     def __init__(self, config: Dict):
         self.config = config
         self.min_profit = config.get("min_profit_per_trade", 200)
-        
+        self.loan_amount = config.get("loan_amount", 75000)
+
     async def scan_volatility_opportunities(self) -> List[TradeSignal]:
-        """Scan for volatility capture opportunities"""
+        """Scan for volatility capture opportunities
+
+        Volatilities are fetched for all tokens in one concurrent batch
+        and masked as a vector before any signal is built.
+        """
         opportunities = []
-        
+
         tokens = self.config.get("tokens", [])
-        
-        for token in tokens:
-            volatility = await self._calculate_volatility(token)
-            
-            if volatility > 0.03:  # High volatility
-                # Volatility breakout opportunity
-                profit_estimate = volatility * self.config.get("loan_amount", 75000) * 10
-                
-                if profit_estimate >= self.min_profit:
-                    signal = TradeSignal(
-                        strategy=TradingStrategy.VOLATILITY,
-                        token_in="USDC",
-                        token_out=token,
-                        amount=self.config.get("loan_amount", 75000),
-                        expected_profit=profit_estimate,
-                        confidence=min(0.9, 0.5 + volatility * 10),
-                        entry_price=1.0,
-                        target_price=1.0 + volatility * 2,
-                        stop_loss=1.0 - volatility * 0.5,
-                        timestamp=time.time(),
-                        timeframe="1h",
-                        indicators={"volatility": volatility}
-                    )
-                    opportunities.append(signal)
-        
+        if not tokens:
+            return opportunities
+
+        amount = self.loan_amount
+        volatilities = await self._calculate_volatility_batch(tokens)
+        profits = volatilities * amount * 10
+
+        keep = (volatilities > 0.03) & (profits >= self.min_profit)
+        for idx in np.flatnonzero(keep):
+            opportunities.append(self._build_signal(
+                tokens[idx], float(volatilities[idx]), amount, float(profits[idx])
+            ))
+
         return opportunities[:5]
+
+    def _build_signal(
+        self, token: str, volatility: float, amount: float, profit_estimate: float,
+        now: Optional[float] = None
+    ) -> TradeSignal:
+        """Build a volatility-capture signal for a surviving token"""
+        if now is None:
+            now = time.time()
+        # Volatility breakout opportunity
+        return TradeSignal(
+            strategy=TradingStrategy.VOLATILITY,
+            token_in="USDC",
+            token_out=token,
+            amount=amount,
+            expected_profit=profit_estimate,
+            confidence=min(0.9, 0.5 + volatility * 10),
+            entry_price=1.0,
+            target_price=1.0 + volatility * 2,
+            stop_loss=1.0 - volatility * 0.5,
+            timestamp=now,
+            timeframe="1h",
+            indicators={"volatility": volatility}
+        )
+
+    async def _calculate_volatility_batch(self, tokens: List[str]) -> np.ndarray:
+        """Volatility for all tokens, one concurrent batch"""
+        values = await asyncio.gather(
+            *[self._calculate_volatility(token) for token in tokens]
+        )
+        return np.fromiter(values, dtype=np.float64, count=len(tokens))
     
     async def _calculate_volatility(self, token: str) -> float:
         """Calculate real token volatility using historical price data"""
         try:
             import aiohttp
-            token_ids = {
-                "ETH": "ethereum", "WETH": "ethereum", "WBTC": "bitcoin",
-                "USDC": "usd-coin", "USDT": "tether", "DAI": "dai",
-                "LINK": "chainlink", "UNI": "uniswap", "AAVE": "aave"
-            }
-            token_id = token_ids.get(token.upper())
+            token_id = COINGECKO_IDS.get(token.upper())
             if not token_id:
                 return 0.0
             url = f"https://api.coingecko.com/api/v3/coins/{token_id}/market_chart"
@@ -942,7 +1571,10 @@ class StatisticalArbitrage:
     def __init__(self, config: Dict):
         self.config = config
         self.min_profit = config.get("min_profit_per_trade", 200)
-        
+        self.loan_amount = config.get("loan_amount", 75000)
+
+        self._session: Optional[aiohttp.ClientSession] = None
+
         # Known correlated pairs
         self.correlated_pairs = [
             ("ETH", "WETH"), ("ETH", "STETH"), ("ETH", "RETH"),
@@ -950,48 +1582,102 @@ class StatisticalArbitrage:
             ("WBTC", "BTC"), ("LINK", "UNI"), ("CRV", "ETH"),
             ("Matic", "WMATIC")
         ]
+
+        # SoA layout: unique tokens once, pairs as an int32 index array so
+        # the spread computation is one contiguous fancy-index per side
+        tokens = list(dict.fromkeys(
+            token.upper() for pair in self.correlated_pairs for token in pair
+        ))
+        self.token_idx = {token: i for i, token in enumerate(tokens)}
+        self.pair_array = np.array(
+            [[self.token_idx[a.upper()], self.token_idx[b.upper()]]
+             for a, b in self.correlated_pairs],
+            dtype=np.int32,
+        )
+        self._token_ids = [COINGECKO_IDS.get(token, "") for token in tokens]
         
     async def scan_statistical_opportunities(self) -> List[TradeSignal]:
-        """Scan for statistical arbitrage opportunities"""
+        """Scan for statistical arbitrage opportunities
+
+        All correlated-pair prices arrive in one batched request and the
+        spreads are computed as a single vector expression.
+        """
         opportunities = []
-        
-        for pair in self.correlated_pairs:
-            spread = await self._calculate_spread(pair[0], pair[1])
-            
-            if abs(spread) > 0.02:  # Significant spread
-                profit_estimate = abs(spread) * self.config.get("loan_amount", 75000) * 3
-                
-                if profit_estimate >= self.min_profit:
-                    direction = "long_spread" if spread > 0 else "short_spread"
-                    
-                    signal = TradeSignal(
-                        strategy=TradingStrategy.STATISTICAL,
-                        token_in=pair[0],
-                        token_out=pair[1],
-                        amount=self.config.get("loan_amount", 75000) / 2,
-                        expected_profit=profit_estimate,
-                        confidence=0.85,
-                        entry_price=1.0,
-                        target_price=1.0,
-                        stop_loss=1.0 - abs(spread) * 0.3,
-                        timestamp=time.time(),
-                        timeframe="30m",
-                        indicators={"spread": spread, "pair": pair, "direction": direction}
-                    )
-                    opportunities.append(signal)
-        
+
+        spreads = await self._calculate_spreads_batch(self.correlated_pairs)
+        profits = np.abs(spreads) * self.loan_amount * 3
+
+        keep = (np.abs(spreads) > 0.02) & (profits >= self.min_profit)
+        now = time.time()
+        for idx in np.flatnonzero(keep):
+            pair = self.correlated_pairs[idx]
+            spread = float(spreads[idx])
+            direction = "long_spread" if spread > 0 else "short_spread"
+
+            signal = TradeSignal(
+                strategy=TradingStrategy.STATISTICAL,
+                token_in=pair[0],
+                token_out=pair[1],
+                amount=self.loan_amount / 2,
+                expected_profit=float(profits[idx]),
+                confidence=0.85,
+                entry_price=1.0,
+                target_price=1.0,
+                stop_loss=1.0 - abs(spread) * 0.3,
+                timestamp=now,
+                timeframe="30m",
+                indicators={"spread": spread, "pair": pair, "direction": direction}
+            )
+            opportunities.append(signal)
+
         return opportunities[:10]
-    
+
+    async def _calculate_spreads_batch(self, pairs) -> np.ndarray:
+        """Spreads for every correlated pair from one batched price call
+
+        One ids=a,b,c request replaces a request per pair; pairs with an
+        unknown token or missing quote contribute a zero spread.
+        """
+        ids = {token_id for token_id in self._token_ids if token_id}
+        prices: Dict[str, float] = {}
+        if ids:
+            try:
+                session = await self._ensure_session()
+                url = (
+                    "https://api.coingecko.com/api/v3/simple/price?ids="
+                    + ",".join(ids) + "&vs_currencies=usd"
+                )
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                    if resp.status == 200:
+                        data = await resp.json()
+                        prices = {
+                            token_id: entry.get("usd", 0.0)
+                            for token_id, entry in data.items()
+                        }
+            except Exception as e:
+                logger.debug(f"Batched spread prices failed: {e}")
+
+        token_prices = np.fromiter(
+            (prices.get(token_id, 0.0) for token_id in self._token_ids),
+            dtype=np.float64, count=len(self._token_ids)
+        )
+        p1 = token_prices[self.pair_array[:, 0]]
+        p2 = token_prices[self.pair_array[:, 1]]
+        return pair_spreads(p1, p2)
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive HTTP session, created lazily"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+            )
+        return self._session
+
     async def _calculate_spread(self, token1: str, token2: str) -> float:
         """Calculate real price spread between correlated tokens"""
         try:
             import aiohttp
-            token_ids = {
-                "ETH": "ethereum", "WETH": "ethereum", "WBTC": "bitcoin",
-                "USDC": "usd-coin", "USDT": "tether", "DAI": "dai",
-                "LINK": "chainlink", "UNI": "uniswap", "AAVE": "aave"
-            }
-            id1, id2 = token_ids.get(token1.upper()), token_ids.get(token2.upper())
+            id1, id2 = COINGECKO_IDS.get(token1.upper()), COINGECKO_IDS.get(token2.upper())
             if not id1 or not id2:
                 return 0.0
             url1 = f"https://api.coingecko.com/api/v3/simple/price?ids={id1},{id2}&vs_currencies=usd"
@@ -1020,33 +1706,41 @@ class CompoundingManager:
         self.current_capital = self.initial_capital
         self.compounding_enabled = config.get("compounding_enabled", True)
         self.compound_ratio = 0.8  # Reinvest 80% of profits
-        
+        # Hottest post-trade path - cache the cap instead of a dict probe
+        # per winning trade
+        self.max_capital = config.get("max_loan_amount", 750000)
+
+        # get_compounded_capital cache, invalidated by capital changes
+        self._capital_snapshot = None
+        self._capital_stats: Dict = {}
+
     def reinvest(self, profit: float) -> float:
         """Reinvest profit into next trade"""
         if not self.compounding_enabled:
             return 0
-        
+
         compound_amount = profit * self.compound_ratio
-        self.current_capital += compound_amount
-        
-        # Cap at max loan amount
-        max_capital = self.config.get("max_loan_amount", 750000)
-        if self.current_capital > max_capital:
-            self.current_capital = max_capital
-        
+        # Cap at max loan amount, branchless
+        self.current_capital = min(
+            self.current_capital + compound_amount, self.max_capital
+        )
+
         return compound_amount
     
     def get_compounded_capital(self) -> Dict:
-        """Get current capital with compounding"""
-        total_return = ((self.current_capital - self.initial_capital) / self.initial_capital) * 100
-        
-        return {
-            "initial_capital": self.initial_capital,
-            "current_capital": self.current_capital,
-            "profit": self.current_capital - self.initial_capital,
-            "total_return_percent": total_return,
-            "compound_count": int(total_return / 10)  # Estimated
-        }
+        """Get current capital with compounding (cached until it changes)"""
+        if self._capital_snapshot != self.current_capital:
+            profit = self.current_capital - self.initial_capital
+            total_return = profit / self.initial_capital * 100
+            self._capital_stats = {
+                "initial_capital": self.initial_capital,
+                "current_capital": self.current_capital,
+                "profit": profit,
+                "total_return_percent": total_return,
+                "compound_count": int(profit * 10 / self.initial_capital)  # Estimated
+            }
+            self._capital_snapshot = self.current_capital
+        return self._capital_stats
 
 
 class AggressiveTradingEngine:
@@ -1074,47 +1768,83 @@ class AggressiveTradingEngine:
         self.winning_trades = 0
         self.losing_trades = 0
         
+        # Hot-path config hoisted out of the scan loops
+        self.loan_amount = config.get("loan_amount", 75000)
+        self.min_profit = config.get("min_profit_per_trade", 200)
+        self.max_concurrent_trades = config.get("max_concurrent_trades", 15)
+        self.scan_interval = config.get("scan_interval_seconds", 0.5)
+
         # Risk management
         self.max_daily_trades = config.get("max_daily_trades", 100)
         self.max_daily_loss = config.get("max_daily_loss", 75000)
         self.today_trades = 0
         self.today_loss = 0.0
-        self.last_reset = time.time()
+        self._next_reset = time.monotonic() + _DAY_SECONDS
+
+        # get_stats cache - dashboards poll it far more often than trades
+        # actually change the underlying counters
+        self._stats_dirty = True
+        self._cached_stats: Dict = {}
         
     async def start(self):
         """Start aggressive trading - AUTONOMOUS LOOP"""
         self.is_running = True
+        self._stats_dirty = True  # get_stats reports is_running
         logger.info("🚀 Aggressive Trading Engine started")
-        
-        # AUTONOMOUS MAIN LOOP
+
+        # AUTONOMOUS MAIN LOOP - the per-cycle work lives in
+        # _scan_and_execute with no try/except on its fast path; errors
+        # are handled here with a consecutive-failure breaker
+        consecutive_errors = 0
         while self.is_running:
             try:
-                # Scan for opportunities
-                opportunities = await self.scan_all_opportunities()
-                
-                if opportunities:
-                    logger.info(f"Found {len(opportunities)} opportunities")
-                    
-                    # Execute best opportunity
-                    best = opportunities[0]
-                    if best.validate():
-                        result = await self.execute_trade(best)
-                        logger.info(f"Trade executed: {result.status}")
-                
-                # Wait before next scan
-                await asyncio.sleep(self.config.get("scan_interval_seconds", 0.5))
-                
+                await self._scan_and_execute()
+                consecutive_errors = 0
             except KeyboardInterrupt:
                 break
             except Exception as e:
-                logger.error(f"Error in trading loop: {e}")
+                consecutive_errors += 1
+                logger.error(
+                    f"Error in trading loop ({consecutive_errors} consecutive): {e}"
+                )
+                if consecutive_errors >= 10:
+                    logger.error("Too many consecutive errors - stopping engine")
+                    break
                 await asyncio.sleep(1)  # Brief pause on error
-        
+                continue
+
+            # Wait before next scan
+            await asyncio.sleep(self.scan_interval)
+
         logger.info("🛑 Aggressive Trading Engine stopped")
-        
+
+    async def _scan_and_execute(self):
+        """One scan/execute cycle - the loop's exception-free fast path"""
+        opportunities = await self.scan_all_opportunities()
+        if not opportunities:
+            return
+
+        logger.info(f"Found {len(opportunities)} opportunities")
+
+        # Execute every validated opportunity concurrently -
+        # submissions overlap their network round-trips
+        validated = [
+            opp for opp in opportunities if opp.validate()
+        ][:self.max_concurrent_trades]
+        if validated:
+            results = await asyncio.gather(
+                *(self.execute_trade(opp) for opp in validated)
+            )
+            wins = sum(1 for r in results if r.success)
+            logger.info(
+                f"Executed {len(results)} trades ({wins} wins, "
+                f"{len(results) - wins} losses)"
+            )
+
     async def stop(self):
         """Stop aggressive trading"""
         self.is_running = False
+        self._stats_dirty = True  # get_stats reports is_running
         logger.info("🛑 Aggressive Trading Engine stopped")
     
     async def scan_all_opportunities(self) -> List[TradeSignal]:
@@ -1127,54 +1857,106 @@ class AggressiveTradingEngine:
         
         all_opportunities = []
         
-        # Scan all strategies concurrently
-        tasks = [
-            self.arbitrage_scanner.scan_arbitrage_opportunities(),
-            self.triangular_scanner.scan_triangular_opportunities(),
-            self.momentum_trader.scan_momentum_opportunities(),
-            self.mean_reversion.scan_mean_reversion_opportunities(),
-            self.volatility_capture.scan_volatility_opportunities(),
-            self.stat_arb.scan_statistical_opportunities(),
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, list):
-                all_opportunities.extend(result)
-        
-        # Sort by expected profit
-        all_opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
+        # Scan all strategies concurrently; the three per-token
+        # strategies are fused into one matrix pass
+        tasks = {
+            "arbitrage": self.arbitrage_scanner.scan_arbitrage_opportunities(),
+            "triangular": self.triangular_scanner.scan_triangular_opportunities(),
+            "token_strategies": self._scan_token_strategies(),
+            "statistical": self.stat_arb.scan_statistical_opportunities(),
+        }
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        # A failing scanner must not sink its siblings, but it must not
+        # fail silently either - a masked empty list looks like "no
+        # opportunities" forever
+        for name, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{name} scan failed: {result!r}")
+                continue
+            all_opportunities.extend(result)
         
-        # Apply risk filters
+        # Apply risk filters, then pick the top K by expected profit -
+        # O(N log K) instead of fully sorting the combined list
         filtered = self._apply_risk_filters(all_opportunities)
-        
-        return filtered[:self.config.get("max_concurrent_trades", 15)]
+
+        return nlargest(self.max_concurrent_trades, filtered, key=_PROFIT_KEY)
     
+    # Per-strategy (threshold, profit multiplier) rows of the fused matrix
+    _TOKEN_STRATEGY_THRESHOLDS = np.array([[0.02], [0.03], [0.03]])
+    _TOKEN_STRATEGY_MULTIPLIERS = np.array([[5.0], [3.0], [10.0]])
+
+    async def _scan_token_strategies(self) -> List[TradeSignal]:
+        """Fused momentum/mean-reversion/volatility scan
+
+        Builds one (3, n_tokens) indicator matrix from the scanners'
+        concurrent batch fetches, applies every threshold and profit
+        cutoff in a single broadcast, and asks each scanner to build
+        signals only for its surviving tokens.
+        """
+        tokens = self.config.get("tokens", [])
+        if not tokens:
+            return []
+
+        amount = self.loan_amount
+        min_profit = self.config.get("min_profit_per_trade", 200)
+
+        momentums, deviations, volatilities = await asyncio.gather(
+            self.momentum_trader._calculate_momentum_batch(tokens),
+            self.mean_reversion._calculate_deviation_batch(tokens),
+            self.volatility_capture._calculate_volatility_batch(tokens),
+        )
+
+        raw = np.vstack((momentums, deviations, volatilities))
+        indicators = np.abs(raw)
+        profit_matrix = indicators * amount * self._TOKEN_STRATEGY_MULTIPLIERS
+        keep = (indicators > self._TOKEN_STRATEGY_THRESHOLDS) & (profit_matrix >= min_profit)
+
+        builders = (
+            self.momentum_trader._build_signal,
+            self.mean_reversion._build_signal,
+            self.volatility_capture._build_signal,
+        )
+        now = time.time()
+        signals = []
+        for strat_idx, token_idx in np.argwhere(keep):
+            signals.append(builders[strat_idx](
+                tokens[token_idx],
+                float(raw[strat_idx, token_idx]),
+                amount,
+                float(profit_matrix[strat_idx, token_idx]),
+                now,
+            ))
+        return signals
+
     def _apply_risk_filters(self, opportunities: List[TradeSignal]) -> List[TradeSignal]:
-        """Apply risk management filters"""
-        filtered = []
-        
-        for opp in opportunities:
-            # Check daily trade limit
-            if self.today_trades >= self.max_daily_trades:
-                break
-            
-            # Check confidence threshold
-            if opp.confidence < 0.6:
-                continue
-            
-            # Check profit threshold
-            if opp.expected_profit < self.config.get("min_profit_per_trade", 200):
-                continue
-            
-            filtered.append(opp)
-        
-        return filtered
+        """Apply risk management filters as one vectorized mask"""
+        if not opportunities:
+            return []
+
+        # Daily trade budget left - nothing passes once it's spent
+        remaining = self.max_daily_trades - self.today_trades
+        if remaining <= 0:
+            return []
+
+        count = len(opportunities)
+        confidences = np.fromiter(
+            (opp.confidence for opp in opportunities), dtype=np.float64, count=count
+        )
+        profits = np.fromiter(
+            (opp.expected_profit for opp in opportunities), dtype=np.float64, count=count
+        )
+
+        mask = (confidences >= 0.6) & (profits >= self.min_profit)
+        # Cap accepted signals to the remaining budget, in list order
+        keep = np.flatnonzero(mask & (np.cumsum(mask) <= remaining))
+        return [opportunities[i] for i in keep]
     
     async def execute_trade(self, signal: TradeSignal) -> TradeResult:
         """Execute a trade signal"""
-        start_time = time.time()
+        start_time = time.perf_counter()  # Monotonic - immune to clock jumps
+        self._stats_dirty = True
         
         try:
             # Simulate trade execution
@@ -1190,8 +1972,8 @@ class AggressiveTradingEngine:
             if success:
                 # Simulate profit (expected - some variance)
                 profit = signal.expected_profit  # Use calculated expected profit
-                gas_cost = await self._estimate_gas_cost(signal)
-                slippage = await self._estimate_slippage(signal)
+                gas_cost = self._estimate_gas_cost(signal)
+                slippage = self._estimate_slippage(signal)
                 
                 net_profit = profit - gas_cost
                 
@@ -1210,8 +1992,8 @@ class AggressiveTradingEngine:
                     profit=net_profit,
                     gas_cost=gas_cost,
                     slippage=slippage,
-                    execution_time=time.time() - start_time,
-                    details={"signal": signal.__dict__}
+                    execution_time=time.perf_counter() - start_time,
+                    details={"signal": signal}
                 )
             else:
                 # Trade failed/lost
@@ -1227,9 +2009,9 @@ class AggressiveTradingEngine:
                     strategy=signal.strategy,
                     profit=-loss,
                     gas_cost=50,
-                    slippage=await self._estimate_slippage(signal),
-                    execution_time=time.time() - start_time,
-                    details={"signal": signal.__dict__}
+                    slippage=self._estimate_slippage(signal),
+                    execution_time=time.perf_counter() - start_time,
+                    details={"signal": signal}
                 )
                 
         except Exception as e:
@@ -1240,23 +2022,96 @@ class AggressiveTradingEngine:
                 profit=0,
                 gas_cost=0,
                 slippage=0,
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 details={"error": str(e)}
             )
     
+    def _estimate_gas_cost(self, signal: TradeSignal) -> float:
+        """Estimate execution gas cost in USD from the path length"""
+        hops = max(1, len(signal.path) - 1) if signal.path else 1
+        return 25.0 * hops
+
+    def _estimate_slippage(self, signal: TradeSignal) -> float:
+        """Estimate slippage fraction from pool depth"""
+        if signal.pool_liquidities:
+            depth = max(signal.pool_liquidities)
+            if depth > 0:
+                return min(0.05, signal.amount_in / depth)
+        return 0.01
+
+    def simulate_trades(self, signals: List[TradeSignal]) -> List[TradeResult]:
+        """Simulate many trade outcomes in one vectorized pass
+
+        Mirrors execute_trade's outcome model (confidence-gated success,
+        expected profit minus estimated costs, half-expected loss on
+        failure) but evaluates every signal as array math - useful for
+        backtests where the per-trade coroutine path would dominate.
+        Counters and compounding update exactly as live execution does.
+        """
+        if not signals:
+            return []
+
+        start_time = time.perf_counter()
+        self._stats_dirty = True
+
+        count = len(signals)
+        confidences = np.fromiter(
+            (s.confidence for s in signals), dtype=np.float64, count=count
+        )
+        expected = np.fromiter(
+            (s.expected_profit for s in signals), dtype=np.float64, count=count
+        )
+        gas_costs = np.fromiter(
+            (self._estimate_gas_cost(s) for s in signals), dtype=np.float64, count=count
+        )
+
+        wins = confidences >= 0.7  # Execute only high-confidence trades
+        profits = np.where(wins, expected - gas_costs, -expected * 0.5)
+
+        execution_time = time.perf_counter() - start_time
+        results = []
+        for i, signal in enumerate(signals):
+            profit = float(profits[i])
+            self.total_trades += 1
+            self.today_trades += 1
+            if wins[i]:
+                self.winning_trades += 1
+                self.total_profit += profit
+                self.compounding.reinvest(profit)
+                gas_cost = float(gas_costs[i])
+            else:
+                self.losing_trades += 1
+                self.today_loss += -profit
+                gas_cost = 50
+            results.append(TradeResult(
+                success=bool(wins[i]),
+                strategy=signal.strategy,
+                profit=profit,
+                gas_cost=gas_cost,
+                slippage=self._estimate_slippage(signal),
+                execution_time=execution_time,
+                details={"signal": signal}
+            ))
+
+        return results
+
     def _check_daily_reset(self):
         """Reset daily counters if new day"""
-        now = time.time()
-        if now - self.last_reset > 86400:  # 24 hours
+        now = time.monotonic()
+        if now > self._next_reset:  # 24 hours
             self.today_trades = 0
             self.today_loss = 0.0
-            self.last_reset = now
+            self._next_reset = now + _DAY_SECONDS
+            self._stats_dirty = True  # get_stats reports the daily counters
     
     def get_stats(self) -> Dict:
-        """Get trading statistics"""
+        """Get trading statistics (recomputed only after trades)"""
+        if not self._stats_dirty:
+            return self._cached_stats
+
         win_rate = (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
-        
-        return {
+
+        stats = {
             "is_running": self.is_running,
             "total_trades": self.total_trades,
             "winning_trades": self.winning_trades,
@@ -1275,7 +2130,10 @@ class AggressiveTradingEngine:
                 "Statistical"
             ]
         }
-    
+        self._cached_stats = stats
+        self._stats_dirty = False
+        return stats
+
     def should_continue(self) -> Tuple[bool, str]:
         """Check if should continue trading"""
         # Check daily loss limit
@@ -0,0 +1,210 @@
+"""
+Technical Indicator Kernels
+Batch EMA/MACD over (n_series, n_candles) price arrays
+
+Compiled with numba when it is installed; the NumPy fallbacks vectorize
+across series per time step, which is already far faster than per-token
+Python loops.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+class PriceHistory:
+    """SoA price history: one (n_tokens, window) float32 ring buffer
+
+    Appends are O(1) writes into a preallocated row; whole-universe
+    indicator math reads a contiguous matrix instead of converting
+    per-token Python lists on every call. FP32 halves the bandwidth -
+    plenty for indicator work.
+    """
+
+    __slots__ = ("window", "_rows", "_data", "_heads", "_counts")
+
+    def __init__(self, tokens, window: int = 500):
+        self.window = window
+        self._rows = {token: i for i, token in enumerate(tokens)}
+        n = max(1, len(self._rows))
+        self._data = np.zeros((n, window), dtype=np.float32)
+        self._heads = np.zeros(n, dtype=np.int32)
+        self._counts = np.zeros(n, dtype=np.int32)
+
+    def _row_for(self, token) -> int:
+        row = self._rows.get(token)
+        if row is None:
+            row = len(self._rows)
+            self._rows[token] = row
+            if row >= self._data.shape[0]:
+                grow = row + 1 - self._data.shape[0]
+                self._data = np.vstack(
+                    (self._data, np.zeros((grow, self.window), dtype=np.float32))
+                )
+                self._heads = np.append(self._heads, np.zeros(grow, dtype=np.int32))
+                self._counts = np.append(self._counts, np.zeros(grow, dtype=np.int32))
+        return row
+
+    def append(self, token, price: float):
+        """Record one price observation for a token"""
+        row = self._row_for(token)
+        head = self._heads[row]
+        self._data[row, head] = price
+        self._heads[row] = (head + 1) % self.window
+        if self._counts[row] < self.window:
+            self._counts[row] += 1
+
+    def count(self, token) -> int:
+        row = self._rows.get(token)
+        return int(self._counts[row]) if row is not None else 0
+
+    def matrix(self, tokens, length: int) -> np.ndarray:
+        """Chronological (len(tokens), length) window ending at the latest tick"""
+        out = np.empty((len(tokens), length), dtype=np.float32)
+        for i, token in enumerate(tokens):
+            row = self._rows[token]
+            head = int(self._heads[row])
+            # Unroll the ring so column -1 is the newest sample
+            rolled = np.roll(self._data[row], -head)
+            count = int(self._counts[row])
+            out[i] = rolled[self.window - min(length, count):][:length]
+        return out
+
+
+class StreamingEMA:
+    """Incremental EMA - O(1) per tick instead of O(period) recompute"""
+
+    __slots__ = ("multiplier", "value", "count")
+
+    def __init__(self, period: int):
+        self.multiplier = 2.0 / (period + 1)
+        self.value = None
+        self.count = 0
+
+    def update(self, price: float) -> float:
+        if self.value is None:
+            self.value = price
+        else:
+            self.value += (price - self.value) * self.multiplier
+        self.count += 1
+        return self.value
+
+
+class StreamingSMA:
+    """Ring-buffer SMA - sum += x - dropped, O(1) per tick"""
+
+    __slots__ = ("period", "buffer", "idx", "total", "count")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.buffer = [0.0] * period
+        self.idx = 0
+        self.total = 0.0
+        self.count = 0
+
+    def update(self, price: float) -> float:
+        dropped = self.buffer[self.idx]
+        self.buffer[self.idx] = price
+        self.idx = (self.idx + 1) % self.period
+        self.total += price - dropped
+        if self.count < self.period:
+            self.count += 1
+        return self.total / self.count
+
+
+def _ema_batch_py(prices: np.ndarray, period: int) -> np.ndarray:
+    """NumPy fallback: EMA along axis 1, vectorized across series"""
+    multiplier = 2.0 / (period + 1)
+    out = np.empty_like(prices, dtype=np.float64)
+    out[:, 0] = prices[:, 0]
+    for t in range(1, prices.shape[1]):
+        out[:, t] = (prices[:, t] - out[:, t - 1]) * multiplier + out[:, t - 1]
+    return out
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _ema_batch_nb(prices, period):  # pragma: no cover - needs numba
+        multiplier = 2.0 / (period + 1)
+        n, t_len = prices.shape
+        out = np.empty((n, t_len), np.float64)
+        for i in range(n):
+            out[i, 0] = prices[i, 0]
+            for t in range(1, t_len):
+                out[i, t] = (prices[i, t] - out[i, t - 1]) * multiplier + out[i, t - 1]
+        return out
+else:
+    _ema_batch_nb = None
+
+
+def ema_batch(prices: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average along axis 1 of an (n, T) price array"""
+    prices = np.asarray(prices, dtype=np.float64)
+    if _ema_batch_nb is not None:
+        return _ema_batch_nb(prices, period)
+    return _ema_batch_py(prices, period)
+
+
+def macd_batch(
+    prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram for an (n, T) price array
+
+    Returns arrays of shape (n, T); the last column is the current value.
+    """
+    fast_ema = ema_batch(prices, fast)
+    slow_ema = ema_batch(prices, slow)
+    macd_line = fast_ema - slow_ema
+    signal_line = ema_batch(macd_line, signal)
+    histogram = macd_line - signal_line
+    return macd_line, signal_line, histogram
+
+
+def _tri_profits_py(r1, r2, r3, amount, gas, fee):
+    """NumPy fallback for the fused triangular profit kernel"""
+    return amount * r1 * r2 * r3 - amount - gas - fee
+
+
+def _pair_spreads_py(prices_a, prices_b):
+    """NumPy fallback for the relative pair-spread kernel"""
+    out = np.zeros_like(prices_a, dtype=np.float64)
+    valid = (prices_a > 0) & (prices_b > 0)
+    out[valid] = (prices_a[valid] - prices_b[valid]) / prices_b[valid]
+    return out
+
+
+if njit is not None:
+    _tri_profits_nb = njit(cache=True, fastmath=True)(_tri_profits_py)  # pragma: no cover
+
+    @njit(cache=True, fastmath=True)
+    def _pair_spreads_nb(prices_a, prices_b):  # pragma: no cover - needs numba
+        out = np.zeros(prices_a.shape[0], np.float64)
+        for i in range(prices_a.shape[0]):
+            if prices_a[i] > 0 and prices_b[i] > 0:
+                out[i] = (prices_a[i] - prices_b[i]) / prices_b[i]
+        return out
+else:
+    _tri_profits_nb = None
+    _pair_spreads_nb = None
+
+
+def tri_profits(
+    r1: np.ndarray, r2: np.ndarray, r3: np.ndarray,
+    amount: float, gas: float, fee: float
+) -> np.ndarray:
+    """Net profit of every triangular path from its three hop rates"""
+    if _tri_profits_nb is not None:
+        return _tri_profits_nb(r1, r2, r3, amount, gas, fee)
+    return _tri_profits_py(r1, r2, r3, amount, gas, fee)
+
+
+def pair_spreads(prices_a: np.ndarray, prices_b: np.ndarray) -> np.ndarray:
+    """Relative spread (a - b) / b per pair; zero where a quote is missing"""
+    if _pair_spreads_nb is not None:
+        return _pair_spreads_nb(prices_a, prices_b)
+    return _pair_spreads_py(prices_a, prices_b)